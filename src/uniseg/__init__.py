@@ -1,7 +1,6 @@
 """Determine Unicode text segmentations."""
 
 from enum import Enum
-from importlib.metadata import PackageNotFoundError, version
 
 __all__ = [
     '__version__',
@@ -9,12 +8,23 @@ __all__ = [
 ]
 
 
-try:
-    __version__ = version(__name__)
-    """Version string of the module."""
-except PackageNotFoundError:
-    # package is not installed
-    pass
+__version__: str
+"""Version string of the module."""
+
+
+def __getattr__(name: str) -> str:
+    # look up the version on demand, as importing importlib.metadata takes
+    # longer than all the rest of the package
+    if name == '__version__':
+        from importlib.metadata import PackageNotFoundError, version
+        try:
+            value = globals()[name] = version(__name__)
+            return value
+        except PackageNotFoundError:
+            # package is not installed
+            pass
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 unidata_version = '16.0.0'
 """Version of the Unicode used in the package."""
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterator
-from copy import copy
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache, wraps
+from itertools import compress
 from typing import (
     Any,
     Callable as TCallable,
@@ -27,12 +29,20 @@ __all__ = [
 ]
 
 
-class Breakable(Enum):
+class Breakable(IntEnum):
     DoNotBreak = 0
     Break = 1
 
-    def __bool__(self) -> bool:
-        return bool(self.value)
+
+# (internal) breakable value for positions not determined yet
+_UNDETERMINED = 2
+_BREAKABLE_VALUES = (Breakable.DoNotBreak, Breakable.Break, None)
+
+# translation table to negate a table of 0 / 1
+_NEGATE = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+# native-endian UTF-32 codec to read a string as an array of code points
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
 
 
 # type aliases for annotation (must use typing generics for 3.8)
@@ -43,12 +53,43 @@ SkipTable = TSequence[Literal[0, 1]]
 
 T = TypeVar('T')
 
+# (internal) the longest strings memoized by the breaking functions; longer
+# ones are computed on every call so that the caches never keep large texts
+_CACHE_MAX_LENGTH = 256
+
+
+def _cache_short_strings(
+    func: TCallable[..., T], /
+) -> TCallable[..., T]:
+    """(internal) Decorate `func`, which takes a string as its first
+    argument, to memoize its results for strings no longer than
+    `_CACHE_MAX_LENGTH`.
+
+    >>> @_cache_short_strings
+    ... def f(s, /):
+    ...     return [len(s)]
+    >>> f('abc') is f('abc')
+    True
+    >>> f('x' * 1000) is f('x' * 1000)
+    False
+    """
+    cached = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def wrapper(s: str, /, *args: Any) -> T:
+        if len(s) <= _CACHE_MAX_LENGTH:
+            return cached(s, *args)
+        return func(s, *args)
+
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
 
 class Run(Generic[T]):
     """A utitlity class which helps treating break determination for a string."""
     __slots__ = [
-        '_text', '_chars', '_attributes', '_skip_table', '_breakables',
-        '_position', '_condition'
+        '_text', '_chars', '_attributes', '_skip_table', '_skipping',
+        '_prev_index', '_next_index', '_breakables', '_position', '_condition'
     ]
 
     def __init__(self, text: str, func: Callable[[str], T] = lambda x: x, /):
@@ -58,14 +99,31 @@ class Run(Generic[T]):
             string to determine breakable information.
         `func`
             property function to get a specific value for each character
-            (code page) of the string.
+            (code page) of the string.  It is called only once for each
+            distinct character in `text`.
         """
         self._text = text
-        self._chars = list(text)
-        self._attributes = [func(c) for c in text]
-        self._skip_table = [1 for __ in text]
-        # Avoid parameterized built-in at runtime for Python 3.8
-        self._breakables = [None for __ in text]
+        # look up every distinct character once, then map the results over
+        # the whole string in C
+        if text.isascii():
+            # one-character ASCII strings are cached by the interpreter
+            table = {c: func(c) for c in set(text)}
+            self._chars = list(text)
+            self._attributes = list(map(table.__getitem__, text))
+        else:
+            # iterate over the code points to avoid allocating a new string
+            # for every character, and share a string for each distinct one
+            code_points = memoryview(
+                text.encode(_UTF32, 'surrogatepass')).cast('I')
+            chars = {ord(c): c for c in set(text)}
+            table = {i: func(c) for i, c in chars.items()}
+            self._chars = list(map(chars.__getitem__, code_points))
+            self._attributes = list(map(table.__getitem__, code_points))
+        self._skip_table = bytearray([1]) * len(text)
+        self._skipping = False
+        self._prev_index: list[int] = []
+        self._next_index: list[int] = []
+        self._breakables = bytearray([_UNDETERMINED]) * len(text)
         self._position = 0
         self._condition = bool(text)
 
@@ -126,7 +184,11 @@ class Run(Generic[T]):
         >>> __ = run.walk() ; run.curr
         'B'
         """
-        return self.attr()
+        # inlined self.attr() for the hottest accessor
+        i = self._position
+        if self._condition and i < len(self._attributes):
+            return self._attributes[i]
+        return None
 
     @property
     def prev(self) -> Optional[T]:
@@ -165,7 +227,11 @@ class Run(Generic[T]):
         >>> __ = run.walk() ; run.cc
         'b'
         """
-        return self.char()
+        # inlined self.char()
+        i = self._position
+        if self._condition and i < len(self._chars):
+            return self._chars[i]
+        return None
 
     @property
     def pc(self) -> Optional[str]:
@@ -209,9 +275,11 @@ class Run(Generic[T]):
     def set_attr(self, attr: T, /) -> None:
         self._attributes[self._position] = attr
 
-    def _calc_position(self, offset: int, /, noskip: bool = False) -> int:
+    def _calc_position(
+        self, offset: int, /, noskip: bool = False, start: Optional[int] = None
+    ) -> int:
         """(internal) Return the index for the result of walking `offset` steps
-        from the current postion.
+        from the current postion, or from `start` if it is specified.
 
         If `noskip` is `True`, skipping values are ignored.
 
@@ -226,15 +294,24 @@ class Run(Generic[T]):
         >>> run._calc_position(3)
         4
         """
-        i = self._position
-        vec = offset // abs(offset) if offset else 0
-        for __ in range(abs(offset)):
+        i = self._position if start is None else start
+        # fast paths: nothing to skip, or a single step in either direction
+        if noskip or not self._skipping:
+            return i + offset
+        skip_table = self._skip_table
+        # single steps from the positions in the text are looked up
+        if offset == 1 and 0 <= i < len(skip_table):
+            return self._next_index[i]
+        if offset == -1 and 0 <= i < len(skip_table):
+            return self._prev_index[i]
+        if offset > 0:
+            vec = 1
+        else:
+            vec, offset = -1, -offset
+        length = len(skip_table)
+        for __ in range(offset):
             i += vec
-            while (
-                0 <= i < len(self._text)
-                and not noskip
-                and self._skip_table[i] == 0
-            ):
+            while 0 <= i < length and skip_table[i] == 0:
                 i += vec
         return i
 
@@ -263,6 +340,16 @@ class Run(Generic[T]):
         else:
             return None
 
+    def __contains__(self, value: object, /) -> bool:
+        """Return if `value` appears in the attributes of the run.
+
+        >>> 'B' in Run('abc', lambda x: x.upper())
+        True
+        >>> 'X' in Run('abc', lambda x: x.upper())
+        False
+        """
+        return value in self._attributes
+
     def attributes(self) -> list[T]:
         """Return a copy of the list of its properties.
 
@@ -274,7 +361,7 @@ class Run(Generic[T]):
 
     def breakables(self) -> list[Optional[Breakable]]:
         """Return a copy of the list of the breakable oppotunity values."""
-        return self._breakables[:]
+        return [_BREAKABLE_VALUES[x] for x in self._breakables]
 
     def walk(self, offset: int = 1, /, noskip: bool = False) -> bool:
         """Move current position for `offset` steps.
@@ -318,10 +405,56 @@ class Run(Generic[T]):
         Skip table must be the sequence of 0 / 1, which lenght is the same as
         the run text. 1 for count, 0 for skip.
         """
-        skip_table = [int(bool(x)) for x in iter_skip]
+        if isinstance(iter_skip, (bytes, bytearray)):
+            # already a table of ints, copied below without visiting every item
+            skip_table = iter_skip
+        else:
+            skip_table = bytearray(map(bool, iter_skip))
         if (len(skip_table) != len(self.text)):
             raise ValueError('Skip table must be the same length as the text')
         self._skip_table[:] = skip_table
+        self._update_skipping()
+
+    def skip(self, values: Iterable[T], /) -> None:
+        """Set the skip table for the run to skip the attributes in `values`.
+
+        >>> run = Run('abc', lambda x: x.upper())
+        >>> run.skip(('B',))
+        >>> run.walk()
+        True
+        >>> run.curr
+        'C'
+        """
+        skip = frozenset(values)
+        # classify all the attributes and flip the flags with translate() in C
+        skip_table = bytearray(map(skip.__contains__, self._attributes))
+        self._skip_table[:] = skip_table.translate(_NEGATE)
+        self._update_skipping()
+
+    def _update_skipping(self) -> None:
+        """(internal) Update the state which depends on the skip table.
+
+        The indices of the nearest counted positions before and after every
+        position are tabulated, so that a single step over skipped positions
+        is a lookup.
+        """
+        skip_table = self._skip_table
+        self._skipping = 0 in skip_table
+        if not self._skipping:
+            return
+        length = len(skip_table)
+        prev_index = [-1] * length
+        next_index = [length] * length
+        last = -1
+        for i, count in enumerate(skip_table):
+            prev_index[i] = last
+            if count:
+                start = max(last, 0)
+                next_index[start:i] = [i] * (i - start)
+                last = i
+        # update the lists in place, which the copies of the run share
+        self._prev_index[:] = prev_index
+        self._next_index[:] = next_index
 
     def is_continuing(
         self,
@@ -378,16 +511,43 @@ class Run(Generic[T]):
         'b'
         """
         attrs = attrinfo if isinstance(attrinfo, tuple) else (attrinfo,)
-        run = copy(self)
         vec = -1 if backward else 1
-        if greedy:
-            while run.attr(vec, noskip=noskip) in attrs:
-                if not run.walk(vec, noskip=noskip):
-                    break
-            condition = True
-        else:
-            condition = run.walk(vec, noskip=noskip) and run.curr in attrs
-        run._condition = self._condition and condition
+        attributes = self._attributes
+        pos = self._position
+        condition = self._condition
+        # scan on the index and create the resulting run only once
+        if condition:
+            if greedy:
+                while True:
+                    i = self._calc_position(vec, noskip=noskip, start=pos)
+                    if not (0 <= i < len(attributes) and attributes[i] in attrs):
+                        break
+                    pos = i
+            else:
+                i = self._calc_position(vec, noskip=noskip, start=pos)
+                if 0 <= i < len(attributes):
+                    pos = i
+                    condition = attributes[i] in attrs
+                else:
+                    pos = 0 if i < 0 else len(attributes) - 1
+                    condition = False
+        return self._copy(pos, condition)
+
+    def _copy(self, position: int, condition: bool, /) -> 'Run[T]':
+        """(internal) Return a shallow copy of the run which is placed on
+        `position` with `condition`.
+        """
+        run = self.__class__.__new__(self.__class__)
+        run._text = self._text
+        run._chars = self._chars
+        run._attributes = self._attributes
+        run._skip_table = self._skip_table
+        run._skipping = self._skipping
+        run._prev_index = self._prev_index
+        run._next_index = self._next_index
+        run._breakables = self._breakables
+        run._position = position
+        run._condition = condition
         return run
 
     def is_following(
@@ -409,25 +569,49 @@ class Run(Generic[T]):
         return self.is_continuing(attrs, greedy=greedy, noskip=noskip)
 
     def break_here(self) -> None:
-        if self._text and self._breakables[self._position] is None:
+        if self._text and self._breakables[self._position] == _UNDETERMINED:
             self._breakables[self._position] = Breakable.Break
 
     def do_not_break_here(self) -> None:
-        if self._text and self._breakables[self._position] is None:
+        if self._text and self._breakables[self._position] == _UNDETERMINED:
             self._breakables[self._position] = Breakable.DoNotBreak
 
     def does_break_here(self) -> bool:
-        return bool(self._breakables[self._position])
+        return self._breakables[self._position] == Breakable.Break
 
     def set_default(self, breakable: Breakable) -> None:
-        self._breakables[:] = [
-            breakable if x is None else x for x in self._breakables
-        ]
+        """Set `breakable` for every position not determined yet.
+
+        The runs sharing the breakables with the instance see the change.
+
+        >>> run = Run('abc')
+        >>> view = run.is_following('a')
+        >>> run.set_default(Breakable.Break)
+        >>> view.breakables()
+        [<Breakable.Break: 1>, <Breakable.Break: 1>, <Breakable.Break: 1>]
+        """
+        self._breakables[:] = self._breakables.replace(
+            bytes([_UNDETERMINED]), bytes([breakable])
+        )
 
     def literal_breakables(
             self, default: Breakable = Breakable.Break
     ) -> Iterable[Literal[0, 1]]:
-        return (default.value if x is None else x.value for x in self._breakables)
+        # bytes, which boundaries() and break_units() take without
+        # converting every item
+        return bytes(self._breakables.replace(
+            bytes([_UNDETERMINED]), bytes([default])
+        ))
+
+
+def _truth_table(breakables: Breakables, /) -> bytes:
+    """(internal) Return `breakables` as bytes whose items are true for
+    breaking positions.
+    """
+    if isinstance(breakables, (bytes, bytearray)):
+        # already a table of ints, copied without visiting every item
+        return bytes(breakables)
+    return bytes(map(bool, breakables))
 
 
 def boundaries(breakables: Breakables, /) -> Iterator[int]:
@@ -448,12 +632,10 @@ def boundaries(breakables: Breakables, /) -> Iterator[int]:
     >>> list(boundaries([]))
     []
     """
-    i = None
-    for i, breakable in enumerate(breakables):
-        if breakable:
-            yield i
-    if i is not None:
-        yield i+1
+    table = _truth_table(breakables)
+    yield from compress(range(len(table)), table)
+    if table:
+        yield len(table)
 
 
 def break_units(s: str, breakables: Breakables, /) -> Iterator[str]:
@@ -468,11 +650,11 @@ def break_units(s: str, breakables: Breakables, /) -> Iterator[str]:
 
     The length of `s` must be equal to that of `breakables`.
     """
+    table = _truth_table(breakables)
     i = 0
-    for j, bk in enumerate(breakables):
-        if bk:
-            if j:
-                yield s[i:j]
+    for j in compress(range(len(table)), table):
+        if j:
+            yield s[i:j]
             i = j
     if s:
         yield s[i:]
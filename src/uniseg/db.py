@@ -1,13 +1,118 @@
 """uniseg database lookup interface. """
 
+from __future__ import annotations
+
 from uniseg.db_lookups import columns, index1, index2, shift, values
 
+_MASK = (1 << shift) - 1
+
+
+def _lookup_index(key: int, /) -> int:
+    index = index1[key >> shift]
+    return index2[(index << shift) + (key & _MASK)]
+
+
+# flat table of the value indices for the BMP (U+0000..U+FFFF), which
+# covers the most of common texts, built by joining the blocks of index2
+_bmp_indices = b''.join(
+    index2[(index1[i] << shift):((index1[i] + 1) << shift)]
+    for i in range(((0x10000 - 1) >> shift) + 1)
+)[:0x10000]
+_latin1_indices = _bmp_indices[:0x100]
+
 
 def get_handle(table_name: str) -> int:
     return columns.index(table_name)
 
 
-def get_value(h_table: int, key: int, /) -> str:
+def get_column(h_table: int, /) -> tuple[str, ...]:
+    """Return the values of the table, ordered by the value index."""
+    return tuple(row[h_table] for row in values)
+
+
+def get_flags(*h_tables: int) -> tuple[int, ...]:
+    """Return the bit sets of the boolean tables, ordered by the value index.
+
+    Bit ``n`` is set if the value of the ``n``-th table is true, so that
+    several boolean properties can be read with a single lookup.
+    """
+    return tuple(
+        sum(bool(row[h]) << n for n, h in enumerate(h_tables))
+        for row in values
+    )
+
+
+def get_bmp_table(table: bytes, /) -> bytes:
+    """Return the flat table for the code points in the BMP, which maps their
+    value indices through `table`.
+    """
+    return _bmp_indices.translate(table.ljust(256, b'\0'))
+
+
+def get_split_table(table: bytes, /) -> tuple[bytes, bytes]:
+    """Return the two-stage table for all the code points, which maps their
+    value indices through `table`.
+
+    The blocks which become identical are shared.  Look up the table with
+    `get_split_value()`.
+    """
+    stage2 = index2.translate(table.ljust(256, b'\0'))
+    blocks: dict[bytes, int] = {}
+    renumber = bytearray(256)
+    for i in range(len(stage2) >> shift):
+        block = stage2[(i << shift):((i + 1) << shift)]
+        renumber[i] = blocks.setdefault(block, len(blocks))
+    return index1.translate(renumber), b''.join(blocks)
+
+
+def get_split_value(split_table: tuple[bytes, bytes], key: int, /) -> int:
+    """Return the value for the code point `key` in the two-stage table."""
+    stage1, stage2 = split_table
+    return stage2[(stage1[key >> shift] << shift) + (key & _MASK)]
+
+
+def get_index(key: int, /) -> int:
+    """Return the value index for the code point `key`."""
+    if key < 0x10000:
+        return _bmp_indices[key]
     index = index1[key >> shift]
-    ivalue = index2[(index << shift) + (key & ((1 << shift) - 1))]
+    return index2[(index << shift) + (key & _MASK)]
+
+
+class _IndexCodes(dict):
+    """(internal) Translation table from code points to their value indices
+    as characters, filled on demand and kept across the calls.
+    """
+
+    def __missing__(self, key: int, /) -> str:
+        if len(self) >= _INDEX_CODES_MAX:
+            self.clear()
+        value = self[key] = chr(get_index(key))
+        return value
+
+
+_INDEX_CODES_MAX = 0x4000
+_index_codes = _IndexCodes()
+
+
+def get_indices(s: str, /) -> bytes:
+    """Return the value indices for every code point of `s`.
+
+    The string is mapped with `str.translate()` through a table which
+    remembers the code points looked up so far.
+    """
+    try:
+        # Latin-1 strings are translated bytewise with no lookup
+        return s.encode('latin-1').translate(_latin1_indices)
+    except UnicodeEncodeError:
+        pass
+    return s.translate(_index_codes).encode('latin-1')
+
+
+def get_value(h_table: int, key: int, /) -> str:
+    if key < 0x10000:
+        ivalue = _bmp_indices[key]
+    else:
+        index = index1[key >> shift]
+        ivalue = index2[(index << shift) + (key & _MASK)]
     return values[ivalue][h_table]
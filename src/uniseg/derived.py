@@ -4,8 +4,11 @@
 <https://www.unicode.org/reports/tr44/tr44-34.html>`_
 """
 
+from __future__ import annotations
+
 from uniseg import Unicode_Property
-from uniseg.db import get_handle, get_value
+from uniseg.db import (get_bmp_table, get_column, get_flags, get_handle,
+                       get_index, get_split_table, get_split_value)
 
 __all__ = [
     'Indic_Conjunct_Break',
@@ -52,6 +55,96 @@ H_GRAPHEME_EXTEND = get_handle('Grapheme_Extend')
 H_GRAPHEME_BASE = get_handle('Grapheme_Base')
 H_INDIC_CONJUNCT_BREAK = get_handle('InCB')
 
+F_MATH = 1 << 0
+F_ALPHABETIC = 1 << 1
+F_LOWERCASE = 1 << 2
+F_UPPERCASE = 1 << 3
+F_CASED = 1 << 4
+F_CASE_IGNORABLE = 1 << 5
+F_CHANGES_WHEN_LOWERCASED = 1 << 6
+F_CHANGES_WHEN_UPPERCASED = 1 << 7
+F_CHANGES_WHEN_TITLECASED = 1 << 8
+F_CHANGES_WHEN_CASEFOLDED = 1 << 9
+F_CHANGES_WHEN_CASEMAPPED = 1 << 10
+F_ID_START = 1 << 11
+F_ID_CONTINUE = 1 << 12
+F_XID_START = 1 << 13
+F_XID_CONTINUE = 1 << 14
+F_DEFAULT_IGNORABLE_CODE_POINT = 1 << 15
+F_GRAPHEME_EXTEND = 1 << 16
+F_GRAPHEME_BASE = 1 << 17
+
+# boolean properties packed into bits, indexed by the value index
+_FLAGS = get_flags(
+    H_MATH,
+    H_ALPHABETIC,
+    H_LOWERCASE,
+    H_UPPERCASE,
+    H_CASED,
+    H_CASE_IGNORABLE,
+    H_CHANGES_WHEN_LOWERCASED,
+    H_CHANGES_WHEN_UPPERCASED,
+    H_CHANGES_WHEN_TITLECASED,
+    H_CHANGES_WHEN_CASEFOLDED,
+    H_CHANGES_WHEN_CASEMAPPED,
+    H_ID_START,
+    H_ID_CONTINUE,
+    H_XID_START,
+    H_XID_CONTINUE,
+    H_DEFAULT_IGNORABLE_CODE_POINT,
+    H_GRAPHEME_EXTEND,
+    H_GRAPHEME_BASE,
+)
+
+
+def _bmp_table(flag: int, /) -> bytes:
+    # flat table of the boolean property for the code points in the BMP
+    return get_bmp_table(bytes(bool(x & flag) for x in _FLAGS))
+
+
+def _split_table(flag: int, /) -> tuple[bytes, bytes]:
+    # two-stage table of the boolean property for all the code points
+    return get_split_table(bytes(bool(x & flag) for x in _FLAGS))
+
+
+_BMP_MATH = _bmp_table(F_MATH)
+_SPLIT_MATH = _split_table(F_MATH)
+_BMP_ALPHABETIC = _bmp_table(F_ALPHABETIC)
+_SPLIT_ALPHABETIC = _split_table(F_ALPHABETIC)
+_BMP_LOWERCASE = _bmp_table(F_LOWERCASE)
+_SPLIT_LOWERCASE = _split_table(F_LOWERCASE)
+_BMP_UPPERCASE = _bmp_table(F_UPPERCASE)
+_SPLIT_UPPERCASE = _split_table(F_UPPERCASE)
+_BMP_CASED = _bmp_table(F_CASED)
+_SPLIT_CASED = _split_table(F_CASED)
+_BMP_CASE_IGNORABLE = _bmp_table(F_CASE_IGNORABLE)
+_SPLIT_CASE_IGNORABLE = _split_table(F_CASE_IGNORABLE)
+_BMP_CHANGES_WHEN_LOWERCASED = _bmp_table(F_CHANGES_WHEN_LOWERCASED)
+_SPLIT_CHANGES_WHEN_LOWERCASED = _split_table(F_CHANGES_WHEN_LOWERCASED)
+_BMP_CHANGES_WHEN_UPPERCASED = _bmp_table(F_CHANGES_WHEN_UPPERCASED)
+_SPLIT_CHANGES_WHEN_UPPERCASED = _split_table(F_CHANGES_WHEN_UPPERCASED)
+_BMP_CHANGES_WHEN_TITLECASED = _bmp_table(F_CHANGES_WHEN_TITLECASED)
+_SPLIT_CHANGES_WHEN_TITLECASED = _split_table(F_CHANGES_WHEN_TITLECASED)
+_BMP_CHANGES_WHEN_CASEFOLDED = _bmp_table(F_CHANGES_WHEN_CASEFOLDED)
+_SPLIT_CHANGES_WHEN_CASEFOLDED = _split_table(F_CHANGES_WHEN_CASEFOLDED)
+_BMP_CHANGES_WHEN_CASEMAPPED = _bmp_table(F_CHANGES_WHEN_CASEMAPPED)
+_SPLIT_CHANGES_WHEN_CASEMAPPED = _split_table(F_CHANGES_WHEN_CASEMAPPED)
+_BMP_ID_START = _bmp_table(F_ID_START)
+_SPLIT_ID_START = _split_table(F_ID_START)
+_BMP_ID_CONTINUE = _bmp_table(F_ID_CONTINUE)
+_SPLIT_ID_CONTINUE = _split_table(F_ID_CONTINUE)
+_BMP_XID_START = _bmp_table(F_XID_START)
+_SPLIT_XID_START = _split_table(F_XID_START)
+_BMP_XID_CONTINUE = _bmp_table(F_XID_CONTINUE)
+_SPLIT_XID_CONTINUE = _split_table(F_XID_CONTINUE)
+_BMP_DEFAULT_IGNORABLE_CODE_POINT = _bmp_table(F_DEFAULT_IGNORABLE_CODE_POINT)
+_SPLIT_DEFAULT_IGNORABLE_CODE_POINT = _split_table(
+    F_DEFAULT_IGNORABLE_CODE_POINT)
+_BMP_GRAPHEME_EXTEND = _bmp_table(F_GRAPHEME_EXTEND)
+_SPLIT_GRAPHEME_EXTEND = _split_table(F_GRAPHEME_EXTEND)
+_BMP_GRAPHEME_BASE = _bmp_table(F_GRAPHEME_BASE)
+_SPLIT_GRAPHEME_BASE = _split_table(F_GRAPHEME_BASE)
+
 
 class Indic_Conjunct_Break(Unicode_Property):
     """Derived Property: Indic_Conjunct_Break."""
@@ -76,7 +169,10 @@ def math(c: str, /) -> bool:
     >>> math('+')
     True
     """
-    return bool(get_value(H_MATH, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_MATH[cp] != 0
+    return get_split_value(_SPLIT_MATH, cp) != 0
 
 
 def alphabetic(c: str, /) -> bool:
@@ -87,7 +183,10 @@ def alphabetic(c: str, /) -> bool:
     >>> alphabetic('1')
     False
     """
-    return bool(get_value(H_ALPHABETIC, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_ALPHABETIC[cp] != 0
+    return get_split_value(_SPLIT_ALPHABETIC, cp) != 0
 
 
 def lowercase(c: str, /) -> bool:
@@ -98,7 +197,10 @@ def lowercase(c: str, /) -> bool:
     >>> lowercase('a')
     True
     """
-    return bool(get_value(H_LOWERCASE, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_LOWERCASE[cp] != 0
+    return get_split_value(_SPLIT_LOWERCASE, cp) != 0
 
 
 def uppercase(c: str, /) -> bool:
@@ -109,7 +211,10 @@ def uppercase(c: str, /) -> bool:
     >>> uppercase('a')
     False
     """
-    return bool(get_value(H_UPPERCASE, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_UPPERCASE[cp] != 0
+    return get_split_value(_SPLIT_UPPERCASE, cp) != 0
 
 
 def cased(c: str, /) -> bool:
@@ -122,7 +227,10 @@ def cased(c: str, /) -> bool:
     >>> cased('*')
     False
     """
-    return bool(get_value(H_CASED, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_CASED[cp] != 0
+    return get_split_value(_SPLIT_CASED, cp) != 0
 
 
 def case_ignorable(c: str, /) -> bool:
@@ -133,7 +241,10 @@ def case_ignorable(c: str, /) -> bool:
     >>> case_ignorable('.')
     True
     """
-    return bool(get_value(H_CASE_IGNORABLE, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_CASE_IGNORABLE[cp] != 0
+    return get_split_value(_SPLIT_CASE_IGNORABLE, cp) != 0
 
 
 def changes_when_lowercased(c: str, /) -> bool:
@@ -145,7 +256,10 @@ def changes_when_lowercased(c: str, /) -> bool:
     >>> changes_when_lowercased('a')
     False
     """
-    return bool(get_value(H_CHANGES_WHEN_LOWERCASED, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_CHANGES_WHEN_LOWERCASED[cp] != 0
+    return get_split_value(_SPLIT_CHANGES_WHEN_LOWERCASED, cp) != 0
 
 
 def changes_when_uppercased(c: str, /) -> bool:
@@ -157,7 +271,10 @@ def changes_when_uppercased(c: str, /) -> bool:
     >>> changes_when_uppercased('a')
     True
     """
-    return bool(get_value(H_CHANGES_WHEN_UPPERCASED, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_CHANGES_WHEN_UPPERCASED[cp] != 0
+    return get_split_value(_SPLIT_CHANGES_WHEN_UPPERCASED, cp) != 0
 
 
 def changes_when_titlecased(c: str, /) -> bool:
@@ -169,7 +286,10 @@ def changes_when_titlecased(c: str, /) -> bool:
     >>> changes_when_titlecased('a')
     True
     """
-    return bool(get_value(H_CHANGES_WHEN_TITLECASED, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_CHANGES_WHEN_TITLECASED[cp] != 0
+    return get_split_value(_SPLIT_CHANGES_WHEN_TITLECASED, cp) != 0
 
 
 def changes_when_casefolded(c: str, /) -> bool:
@@ -181,7 +301,10 @@ def changes_when_casefolded(c: str, /) -> bool:
     >>> changes_when_casefolded('a')
     False
     """
-    return bool(get_value(H_CHANGES_WHEN_CASEFOLDED, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_CHANGES_WHEN_CASEFOLDED[cp] != 0
+    return get_split_value(_SPLIT_CHANGES_WHEN_CASEFOLDED, cp) != 0
 
 
 def changes_when_casemapped(c: str, /) -> bool:
@@ -195,7 +318,10 @@ def changes_when_casemapped(c: str, /) -> bool:
     >>> changes_when_casemapped('1')
     False
     """
-    return bool(get_value(H_CHANGES_WHEN_CASEMAPPED, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_CHANGES_WHEN_CASEMAPPED[cp] != 0
+    return get_split_value(_SPLIT_CHANGES_WHEN_CASEMAPPED, cp) != 0
 
 
 def id_start(c: str, /) -> bool:
@@ -208,7 +334,10 @@ def id_start(c: str, /) -> bool:
     >>> id_start('1')
     False
     """
-    return bool(get_value(H_ID_START, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_ID_START[cp] != 0
+    return get_split_value(_SPLIT_ID_START, cp) != 0
 
 
 def id_continue(c: str, /) -> bool:
@@ -223,7 +352,10 @@ def id_continue(c: str, /) -> bool:
     >>> id_continue('.')
     False
     """
-    return bool(get_value(H_ID_CONTINUE, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_ID_CONTINUE[cp] != 0
+    return get_split_value(_SPLIT_ID_CONTINUE, cp) != 0
 
 
 def xid_start(c: str, /) -> bool:
@@ -236,7 +368,10 @@ def xid_start(c: str, /) -> bool:
     >>> xid_start('1')
     False
     """
-    return bool(get_value(H_XID_START, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_XID_START[cp] != 0
+    return get_split_value(_SPLIT_XID_START, cp) != 0
 
 
 def xid_continue(c: str, /) -> bool:
@@ -251,7 +386,10 @@ def xid_continue(c: str, /) -> bool:
     >>> xid_continue('.')
     False
     """
-    return bool(get_value(H_XID_CONTINUE, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_XID_CONTINUE[cp] != 0
+    return get_split_value(_SPLIT_XID_CONTINUE, cp) != 0
 
 
 def default_ignorable_code_point(c: str, /) -> bool:
@@ -263,7 +401,10 @@ def default_ignorable_code_point(c: str, /) -> bool:
     >>> default_ignorable_code_point('\u00ad')
     True
     """
-    return bool(get_value(H_DEFAULT_IGNORABLE_CODE_POINT, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_DEFAULT_IGNORABLE_CODE_POINT[cp] != 0
+    return get_split_value(_SPLIT_DEFAULT_IGNORABLE_CODE_POINT, cp) != 0
 
 
 def grapheme_extend(c: str, /) -> bool:
@@ -274,7 +415,10 @@ def grapheme_extend(c: str, /) -> bool:
     >>> grapheme_extend('\u0300')
     True
     """
-    return bool(get_value(H_GRAPHEME_EXTEND, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_GRAPHEME_EXTEND[cp] != 0
+    return get_split_value(_SPLIT_GRAPHEME_EXTEND, cp) != 0
 
 
 def grapheme_base(c: str, /) -> bool:
@@ -285,7 +429,17 @@ def grapheme_base(c: str, /) -> bool:
     >>> grapheme_extend('\u0300')
     True
     """
-    return bool(get_value(H_GRAPHEME_BASE, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_GRAPHEME_BASE[cp] != 0
+    return get_split_value(_SPLIT_GRAPHEME_BASE, cp) != 0
+
+
+# property values indexed by the value index of the database
+_INCB_TABLE = tuple(
+    Indic_Conjunct_Break[x or 'None_']
+    for x in get_column(H_INDIC_CONJUNCT_BREAK)
+)
 
 
 def indic_conjunct_break(c: str, /) -> Indic_Conjunct_Break:
@@ -296,9 +450,7 @@ def indic_conjunct_break(c: str, /) -> Indic_Conjunct_Break:
     >>> indic_conjunct_break('\u094d')
     Indic_Conjunct_Break.Linker
     """
-    return Indic_Conjunct_Break[
-        get_value(H_INDIC_CONJUNCT_BREAK, ord(c)) or 'None_'
-    ]
+    return _INCB_TABLE[get_index(ord(c))]
 
 
 if __name__ == '__main__':
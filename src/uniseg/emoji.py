@@ -4,7 +4,10 @@
 <https://www.unicode.org/reports/tr51/tr51-27.html>`_
 """
 
-from uniseg.db import get_handle, get_value
+from __future__ import annotations
+
+from uniseg.db import (get_bmp_table, get_flags, get_handle, get_split_table,
+                       get_split_value)
 
 __all__ = [
     'emoji',
@@ -21,6 +24,43 @@ H_EMOJI_MODIFIER_BASE = get_handle('Emoji_Modifier_Base')
 H_EMOJI_COMPONENT = get_handle('Emoji_Component')
 H_EXTENDED_PICTOGRAPHIC = get_handle('Extended_Pictographic')
 
+F_EMOJI = 1 << 0
+F_EMOJI_PRESENTATION = 1 << 1
+F_EMOJI_MODIFIER_BASE = 1 << 2
+F_EMOJI_COMPONENT = 1 << 3
+F_EXTENDED_PICTOGRAPHIC = 1 << 4
+
+# boolean properties packed into bits, indexed by the value index
+_FLAGS = get_flags(
+    H_EMOJI,
+    H_EMOJI_PRESENTATION,
+    H_EMOJI_MODIFIER_BASE,
+    H_EMOJI_COMPONENT,
+    H_EXTENDED_PICTOGRAPHIC,
+)
+
+
+def _bmp_table(flag: int, /) -> bytes:
+    # flat table of the boolean property for the code points in the BMP
+    return get_bmp_table(bytes(bool(x & flag) for x in _FLAGS))
+
+
+def _split_table(flag: int, /) -> tuple[bytes, bytes]:
+    # two-stage table of the boolean property for all the code points
+    return get_split_table(bytes(bool(x & flag) for x in _FLAGS))
+
+
+_BMP_EMOJI = _bmp_table(F_EMOJI)
+_SPLIT_EMOJI = _split_table(F_EMOJI)
+_BMP_EMOJI_PRESENTATION = _bmp_table(F_EMOJI_PRESENTATION)
+_SPLIT_EMOJI_PRESENTATION = _split_table(F_EMOJI_PRESENTATION)
+_BMP_EMOJI_MODIFIER_BASE = _bmp_table(F_EMOJI_MODIFIER_BASE)
+_SPLIT_EMOJI_MODIFIER_BASE = _split_table(F_EMOJI_MODIFIER_BASE)
+_BMP_EMOJI_COMPONENT = _bmp_table(F_EMOJI_COMPONENT)
+_SPLIT_EMOJI_COMPONENT = _split_table(F_EMOJI_COMPONENT)
+_BMP_EXTENDED_PICTOGRAPHIC = _bmp_table(F_EXTENDED_PICTOGRAPHIC)
+_SPLIT_EXTENDED_PICTOGRAPHIC = _split_table(F_EXTENDED_PICTOGRAPHIC)
+
 
 def emoji(c: str, /) -> bool:
     """Return Emoji boolean Unicode property value for `c`.
@@ -30,7 +70,10 @@ def emoji(c: str, /) -> bool:
     >>> emoji('🐸')
     True
     """
-    return bool(get_value(H_EMOJI, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_EMOJI[cp] != 0
+    return get_split_value(_SPLIT_EMOJI, cp) != 0
 
 
 def emoji_presentation(c: str, /) -> bool:
@@ -41,7 +84,10 @@ def emoji_presentation(c: str, /) -> bool:
     >>> emoji_presentation('🌞')
     True
     """
-    return bool(get_value(H_EMOJI_PRESENTATION, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_EMOJI_PRESENTATION[cp] != 0
+    return get_split_value(_SPLIT_EMOJI_PRESENTATION, cp) != 0
 
 
 def emoji_modifier_base(c: str, /) -> bool:
@@ -52,7 +98,10 @@ def emoji_modifier_base(c: str, /) -> bool:
     >>> emoji_modifier_base('👼')
     True
     """
-    return bool(get_value(H_EMOJI_MODIFIER_BASE, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_EMOJI_MODIFIER_BASE[cp] != 0
+    return get_split_value(_SPLIT_EMOJI_MODIFIER_BASE, cp) != 0
 
 
 def emoji_component(c: str, /) -> bool:
@@ -63,7 +112,10 @@ def emoji_component(c: str, /) -> bool:
     >>> emoji_component('#')
     True
     """
-    return bool(get_value(H_EMOJI_COMPONENT, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_EMOJI_COMPONENT[cp] != 0
+    return get_split_value(_SPLIT_EMOJI_COMPONENT, cp) != 0
 
 
 def extended_pictographic(c: str, /) -> bool:
@@ -74,7 +126,10 @@ def extended_pictographic(c: str, /) -> bool:
     >>> extended_pictographic('🐤')
     True
     """
-    return bool(get_value(H_EXTENDED_PICTOGRAPHIC, ord(c)))
+    cp = ord(c)
+    if cp < 0x10000:
+        return _BMP_EXTENDED_PICTOGRAPHIC[cp] != 0
+    return get_split_value(_SPLIT_EXTENDED_PICTOGRAPHIC, cp) != 0
 
 
 if __name__ == '__main__':
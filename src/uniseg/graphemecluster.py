@@ -4,14 +4,18 @@
 <https://www.unicode.org/reports/tr29/tr29-45.html>`_
 """
 
-from typing import Iterator, Optional
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
 
 from uniseg import Unicode_Property
-from uniseg.breaking import (Breakable, Breakables, Run, TailorBreakables, boundaries,
-                             break_units)
-from uniseg.db import get_handle, get_value
-from uniseg.derived import InCB, indic_conjunct_break
-from uniseg.emoji import extended_pictographic
+from uniseg.breaking import (Breakable, Breakables, TailorBreakables,
+                             _cache_short_strings, boundaries, break_units)
+from uniseg.db import get_column, get_handle, get_index, get_indices
+from uniseg.derived import H_INDIC_CONJUNCT_BREAK, InCB, Indic_Conjunct_Break
+from uniseg.emoji import H_EXTENDED_PICTOGRAPHIC
 
 __all__ = [
     'Grapheme_Cluster_Break',
@@ -62,10 +66,14 @@ class Grapheme_Cluster_Break(Unicode_Property):
 GCB = Grapheme_Cluster_Break
 
 
-def _ep(c: Optional[str], /) -> Optional[bool]:
-    return False if c is None else extended_pictographic(c)
+# property values indexed by the value index of the database
+_GCB_TABLE = tuple(
+    Grapheme_Cluster_Break[x or 'Other']
+    for x in get_column(H_GRAPHEME_CLUSTER_BREAK)
+)
 
 
+@lru_cache(maxsize=1024)
 def grapheme_cluster_break(c: str, /) -> Grapheme_Cluster_Break:
     R"""Return the Grapheme_Cluster_Break property of `c`.
 
@@ -78,9 +86,109 @@ def grapheme_cluster_break(c: str, /) -> Grapheme_Cluster_Break:
     >>> print(grapheme_cluster_break('\n'))
     LF
     """
-    return Grapheme_Cluster_Break[
-        get_value(H_GRAPHEME_CLUSTER_BREAK, ord(c)) or 'Other'
-    ]
+    return _GCB_TABLE[get_index(ord(c))]
+
+
+# the classes of characters for the grapheme cluster pattern, which are coded
+# as single characters in the combination of the Grapheme_Cluster_Break,
+# Indic_Conjunct_Break and Extended_Pictographic properties
+_CLASSES = [
+    (gcb, incb, ep) for gcb in GCB for incb in InCB for ep in (False, True)
+]
+_CONTROLS = (GCB.CR, GCB.LF, GCB.Control)
+_POSTCORES = (GCB.Extend, GCB.ZWJ, GCB.SpacingMark)
+# class codes indexed by the value index of the database
+_CLASS_TABLE = bytes(
+    _CLASSES.index((gcb, InCB[incb or 'None_'], bool(ep)))
+    for gcb, incb, ep in zip(
+        _GCB_TABLE,
+        get_column(H_INDIC_CONJUNCT_BREAK),
+        get_column(H_EXTENDED_PICTOGRAPHIC),
+    )
+).ljust(256, b'\0')
+
+
+def _class_pattern(
+    predicate: Callable[[Grapheme_Cluster_Break, Indic_Conjunct_Break, bool],
+                        bool],
+    /
+) -> str:
+    return '[{}]'.format(''.join(
+        re.escape(chr(i)) for i, x in enumerate(_CLASSES) if predicate(*x)
+    ))
+
+
+def _gcb_pattern(*gcbs: Grapheme_Cluster_Break) -> str:
+    return _class_pattern(lambda gcb, incb, ep: gcb in gcbs)
+
+
+def _incb_pattern(incb_: Indic_Conjunct_Break, /) -> str:
+    # conjunct clusters only continue with the characters which also extend
+    # the cluster in the sense of GB9 and GB9a
+    return _class_pattern(
+        lambda gcb, incb, ep: incb == incb_ and gcb in _POSTCORES)
+
+
+def _build_pattern() -> re.Pattern[bytes]:
+    """(internal) Build the extended grapheme cluster pattern in UAX #29
+    Table 1b, which is equivalent to the rules GB3 to GB999.
+    """
+    cr = _gcb_pattern(GCB.CR)
+    lf = _gcb_pattern(GCB.LF)
+    control = _gcb_pattern(*_CONTROLS)
+    prepend = _gcb_pattern(GCB.Prepend)
+    postcore = _gcb_pattern(*_POSTCORES)
+    l_, v, t, lv, lvt = (_gcb_pattern(x) for x in (
+        GCB.L, GCB.V, GCB.T, GCB.LV, GCB.LVT))
+    ri = _gcb_pattern(GCB.Regional_Indicator)
+    extend = _gcb_pattern(GCB.Extend)
+    zwj = _gcb_pattern(GCB.ZWJ)
+    xpicto = _class_pattern(lambda gcb, incb, ep: ep and gcb == GCB.Other)
+    consonant = _class_pattern(
+        lambda gcb, incb, ep: incb == InCB.Consonant and gcb == GCB.Other)
+    linker = _incb_pattern(InCB.Linker)
+    linker_or_extend = '(?:{}|{})'.format(linker, _incb_pattern(InCB.Extend))
+    noncontrol = _class_pattern(lambda gcb, incb, ep: gcb not in _CONTROLS)
+    hangul_syllable = f'{l_}*(?:{v}+|{lv}{v}*|{lvt}){t}*|{l_}+|{t}+'
+    ri_pair = f'{ri}{ri}'
+    xpicto_sequence = f'{xpicto}(?:{extend}*{zwj}{xpicto})*'
+    conjunct_cluster = (
+        f'{consonant}(?:{linker_or_extend}*{linker}{linker_or_extend}*'
+        f'{consonant})+'
+    )
+    core = (
+        f'(?:{hangul_syllable}|{ri_pair}|{xpicto_sequence}'
+        f'|{conjunct_cluster}|{noncontrol})'
+    )
+    return re.compile(
+        f'{cr}{lf}|{control}|{prepend}*{core}{postcore}*'.encode('latin-1'))
+
+
+def _build_simple_pattern() -> re.Pattern[bytes]:
+    """(internal) Build the pattern reduced for the strings which have no
+    characters in `_SPECIAL_PATTERN`.
+    """
+    cr = _gcb_pattern(GCB.CR)
+    lf = _gcb_pattern(GCB.LF)
+    control = _gcb_pattern(*_CONTROLS)
+    prepend = _gcb_pattern(GCB.Prepend)
+    postcore = _gcb_pattern(*_POSTCORES)
+    noncontrol = _class_pattern(lambda gcb, incb, ep: gcb not in _CONTROLS)
+    return re.compile(
+        f'{cr}{lf}|{control}|{prepend}*{noncontrol}{postcore}*'
+        .encode('latin-1'))
+
+
+_PATTERN = _build_pattern()
+_SIMPLE_PATTERN = _build_simple_pattern()
+# characters which can start a Hangul syllable, a regional indicator pair,
+# an emoji sequence or a conjunct cluster
+_SPECIAL_PATTERN = re.compile(_class_pattern(
+    lambda gcb, incb, ep: (
+        gcb in (GCB.L, GCB.V, GCB.T, GCB.LV, GCB.LVT, GCB.Regional_Indicator)
+        or (gcb == GCB.Other and (ep or incb == InCB.Consonant))
+    )
+).encode('latin-1'))
 
 
 def grapheme_cluster_breakables(s: str, /) -> Breakables:
@@ -97,69 +205,36 @@ def grapheme_cluster_breakables(s: str, /) -> Breakables:
     >>> list(grapheme_cluster_breakables(''))
     []
     """
-    if not s:
-        return iter([])
-
-    run = Run(s, indic_conjunct_break)
-    while run.walk():
-        if (
-            run.is_following((InCB.Extend, InCB.Linker),
-                             greedy=True).prev == InCB.Consonant
-            and run.is_following(InCB.Extend, greedy=True).prev != InCB.Consonant
-            and run.curr == InCB.Consonant
-        ):
-            run.do_not_break_here()
-    incb_breakables = run.breakables()
-
-    run = Run(s, grapheme_cluster_break)
-    while run.walk():
-        # GB3
-        if run.prev == GCB.CR and run.curr == GCB.LF:
-            run.do_not_break_here()
-        # GB4, GB5
-        elif (
-            run.prev in (GCB.Control, GCB.CR, GCB.LF)
-            or run.curr in (GCB.Control, GCB.CR, GCB.LF)
-        ):
-            run.break_here()
-        # GB6, GB7, GB8
-        elif (
-            (run.prev == GCB.L and run.curr in (GCB.L, GCB.V, GCB.LV, GCB.LVT))
-            or (run.prev in (GCB.LV, GCB.V) and run.curr in (GCB.V, GCB.T))
-            or (run.prev in (GCB.LVT, GCB.T) and run.curr == GCB.T)
-        ):
-            run.do_not_break_here()
-        elif run.curr in (GCB.Extend, GCB.ZWJ):
-            run.do_not_break_here()
-        # GB9a, GB9b
-        elif run.curr == GCB.SpacingMark or run.prev == GCB.Prepend:
-            run.do_not_break_here()
-        # GB9c
-        elif incb_breakables[run.position] is Breakable.DoNotBreak:
-            run.do_not_break_here()
-        # GB11
-        elif (
-            _ep(run.is_following(GCB.ZWJ).is_following(
-                GCB.Extend, greedy=True).pc)
-            and _ep(run.cc)
-        ):
-            run.do_not_break_here()
-    # GB12, GB13
-    run.head()
-    while 1:
-        while run.curr != GCB.Regional_Indicator:
-            if not run.walk():
-                break
-        if not run.walk():
-            break
-        while run.prev == run.curr == GCB.Regional_Indicator:
-            run.do_not_break_here()
-            if not run.walk():
-                break
-            if not run.walk():
-                break
-    run.set_default(Breakable.Break)
-    return run.literal_breakables()
+    return _grapheme_cluster_breakables(s)
+
+
+@_cache_short_strings
+def _grapheme_cluster_breakables(s: str, /) -> bytes:
+    if s.isascii():
+        # ASCII characters are Other, Control, CR or LF, and CR LF is the
+        # only cluster of more than one of them (GB3)
+        breakables = bytearray([Breakable.Break]) * len(s)
+        i = s.find('\r\n')
+        while i >= 0:
+            breakables[i + 1] = Breakable.DoNotBreak
+            i = s.find('\r\n', i + 2)
+        return bytes(breakables)
+    # classify the whole string into the class codes, then find the
+    # clusters with the pattern
+    codes = get_indices(s).translate(_CLASS_TABLE)
+    if _SPECIAL_PATTERN.search(codes):
+        pattern = _PATTERN
+    else:
+        pattern = _SIMPLE_PATTERN
+    breakables = bytearray(len(s))
+    for m in pattern.finditer(codes):
+        breakables[m.start()] = Breakable.Break
+    return bytes(breakables)
+
+
+def _is_simple_ascii(s: str, /) -> bool:
+    # every character of ASCII strings without CR LF is a grapheme cluster
+    return s.isascii() and '\r\n' not in s
 
 
 def grapheme_cluster_boundaries(
@@ -176,6 +251,8 @@ def grapheme_cluster_boundaries(
     >>> list(grapheme_cluster_boundaries(''))
     []
     """
+    if tailor is None and _is_simple_ascii(s):
+        return iter(range(len(s) + 1 if s else 0))
     breakables = grapheme_cluster_breakables(s)
     if tailor is not None:
         breakables = tailor(s, breakables)
@@ -226,6 +303,8 @@ def grapheme_clusters(
     >>> list(grapheme_clusters('Czech', tailor_grapheme_cluster_breakables))
     ['C', 'z', 'e', 'ch']
     """
+    if tailor is None and _is_simple_ascii(s):
+        return iter(s)
     breakables = grapheme_cluster_breakables(s)
     if tailor is not None:
         breakables = tailor(s, breakables)
@@ -6,15 +6,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 from typing import Optional
 
 from uniseg import Unicode_Property
-from uniseg.breaking import (Breakable, Breakables, Run, TailorBreakables, boundaries,
-                             break_units)
-from uniseg.db import get_handle, get_value
+from uniseg.breaking import (Breakable, Breakables, Run, TailorBreakables,
+                             _cache_short_strings, boundaries, break_units)
+from uniseg.db import get_column, get_handle, get_index
 from uniseg.emoji import extended_pictographic
-from uniseg.unicodedata_ import (EA, GC, East_Asian_Width, General_Category,
+from uniseg.unicodedata_ import (EA, GC, General_Category,
                                  east_asian_width_, general_category_)
 
 __all__ = [
@@ -135,7 +136,85 @@ LB = Line_Break
 
 EastAsianTuple = (EA.F, EA.W, EA.H)
 
-
+# groups of property values which the rules test for, built once
+NewlineTuple = (LB.CR, LB.LF, LB.NL)
+BreakTuple = (LB.BK,) + NewlineTuple
+SpaceTuple = (LB.SP, LB.ZW)
+BreakSpaceTuple = BreakTuple + SpaceTuple
+CombiningTuple = (LB.CM, LB.ZWJ)
+AlphabeticTuple = (LB.AL, LB.HL)
+AlphaNumericTuple = AlphabeticTuple + (LB.NU,)
+NumericAffixTuple = (LB.PO, LB.PR)
+HangulTuple = (LB.JL, LB.JV, LB.JT, LB.H2, LB.H3)
+AksaraTuple = (LB.AK, LB.AS)
+IdeographicTuple = (LB.ID, LB.EB, LB.EM)
+InfixTuple = (LB.SY, LB.IS)
+HyphenTuple = (LB.HY, LB.BA)
+CloseTuple = (LB.CL, LB.CP)
+ViramaTuple = (LB.VF, LB.VI)
+LB15aPrecedingTuple = BreakSpaceTuple + (LB.OP, LB.QU, LB.GL)
+LB15bFollowingTuple = BreakSpaceTuple + (
+    LB.GL, LB.WJ, LB.CL, LB.QU, LB.CP, LB.EX, LB.IS, LB.SY)
+LB20aPrecedingTuple = BreakSpaceTuple + (LB.CB, LB.GL)
+LB21Tuple = (LB.BA, LB.HY, LB.NS)
+LB25PrecedingTuple = (LB.HY, LB.IS)
+
+# values any string of which has no line breaking opportunity: LB2, LB9,
+# LB10, LB23, LB25 and LB28 prohibit all the breaks between them
+_UNBREAKABLE = frozenset((LB.AL, LB.HL, LB.NU, LB.CM, LB.ZWJ))
+
+
+def _pairs(
+    prevs: Iterable[Line_Break], currs: Iterable[Line_Break], /
+) -> frozenset[tuple[Line_Break, Line_Break]]:
+    return frozenset((p, c) for p in prevs for c in currs)
+
+
+# pairs of the previous and the current values which the consecutive rules
+# decide "do not break" by themselves, so that each group is tested with a
+# single lookup
+_LB11_LB13_PAIRS = (
+    # LB11
+    _pairs(LB, (LB.WJ,)) | _pairs((LB.WJ,), LB)
+    # LB12
+    | _pairs((LB.GL,), LB)
+    # LB12a
+    | _pairs((x for x in LB if x not in (LB.SP, LB.BA, LB.HY)), (LB.GL,))
+    # LB13
+    | _pairs(LB, (LB.CL, LB.CP, LB.EX, LB.SY))
+)
+_LB21B_LB24_PAIRS = (
+    # LB21b
+    _pairs((LB.SY,), (LB.HL,))
+    # LB22
+    | _pairs(LB, (LB.IN,))
+    # LB23
+    | _pairs(AlphabeticTuple, (LB.NU,)) | _pairs((LB.NU,), AlphabeticTuple)
+    # LB23a
+    | _pairs((LB.PR,), IdeographicTuple) | _pairs(IdeographicTuple, (LB.PO,))
+    # LB24
+    | _pairs(NumericAffixTuple, AlphabeticTuple)
+    | _pairs(AlphabeticTuple, NumericAffixTuple)
+)
+_LB26_LB28_PAIRS = (
+    # LB26
+    _pairs((LB.JL,), (LB.JL, LB.JV, LB.H2, LB.H3))
+    | _pairs((LB.JV, LB.H2), (LB.JV, LB.JT))
+    | _pairs((LB.JT, LB.H3), (LB.JT,))
+    # LB27
+    | _pairs(HangulTuple, (LB.PO,)) | _pairs((LB.PR,), HangulTuple)
+    # LB28
+    | _pairs(AlphabeticTuple, AlphabeticTuple)
+)
+
+
+# property values indexed by the value index of the database
+_LB_TABLE = tuple(
+    Line_Break[x or 'XX'] for x in get_column(H_LINE_BREAK)
+)
+
+
+@lru_cache(maxsize=1024)
 def line_break(c: str, /) -> Line_Break:
     R"""Return the Line_Break property for `c`.
 
@@ -150,36 +229,54 @@ def line_break(c: str, /) -> Line_Break:
     >>> line_break('᭄') # (== '\u1b44')
     Line_Break.VI
     """
-    return Line_Break[get_value(H_LINE_BREAK, ord(c)) or 'XX']
-
-
-def _ea(c: Optional[str], /) -> Optional[East_Asian_Width]:
-    return None if c is None else east_asian_width_(c)
-
-
-def _cat(c: Optional[str], /) -> Optional[General_Category]:
-    return None if c is None else general_category_(c)
+    return _LB_TABLE[get_index(ord(c))]
 
 
 def _extpict(c: Optional[str], /) -> Optional[bool]:
     return False if c is None else extended_pictographic(c)
 
 
+# property values resolved by LB1, except for SA which depends on
+# General_Category, indexed by the value index of the database
+_LB1_TABLE = tuple(
+    LB.AL if lb in (LB.AI, LB.SG, LB.XX) else LB.NS if lb == LB.CJ else lb
+    for lb in _LB_TABLE
+)
+
+
+@lru_cache(maxsize=1024)
 def resolve_lb1_linebreak(c: str, /) -> Line_Break:
-    lb = line_break(c)
-    cat = general_category_(c)
-    if lb in (LB.AI, LB.SG, LB.XX):
-        lb = LB.AL
-    elif lb == LB.SA:
-        if cat in (GC.Mn, GC.Mc):
+    lb = _LB1_TABLE[get_index(ord(c))]
+    if lb == LB.SA:
+        if general_category_(c) in (GC.Mn, GC.Mc):
             lb = LB.CM
         else:
             lb = LB.AL
-    elif lb == LB.CJ:
-        lb = LB.NS
     return lb
 
 
+def _properties(c: str, /) -> tuple[bool, bool, General_Category]:
+    """(internal) Return if the East_Asian_Width of `c` is A, if it is none of
+    F, W and H, and the General_Category of `c`.
+    """
+    ea = east_asian_width_(c)
+    return ea == EA.A, ea not in EastAsianTuple, general_category_(c)
+
+
+# the results of `_properties()` for ASCII characters, plus the values for
+# the out of the string (`None`)
+_ASCII_PROPERTIES = [(c, *_properties(c)) for c in map(chr, range(0x80))]
+_ASCII_AMBIGUOUS: dict[Optional[str], bool] = {
+    None: False, **{c: x for c, x, _, _ in _ASCII_PROPERTIES}
+}
+_ASCII_NARROW: dict[Optional[str], bool] = {
+    None: True, **{c: x for c, _, x, _ in _ASCII_PROPERTIES}
+}
+_ASCII_CATS: dict[Optional[str], Optional[General_Category]] = {
+    None: None, **{c: x for c, _, _, x in _ASCII_PROPERTIES}
+}
+
+
 def line_break_breakables(s: str, /, legacy: bool = False) -> Breakables:
     """Iterate line breaking opportunities for every position of `s`
 
@@ -193,102 +290,127 @@ def line_break_breakables(s: str, /, legacy: bool = False) -> Breakables:
     >>> list(line_break_breakables(''))
     []
     """
+    return _line_break_breakables(s, legacy)
+
+
+@_cache_short_strings
+def _line_break_breakables(s: str, legacy: bool, /) -> Breakables:
     if not s:
-        return iter([])
+        return b''
 
     # LB1
     run = Run(s, resolve_lb1_linebreak)
-    if legacy:
-        while 1:
-            if _ea(run.cc) == EA.A:
-                run.set_attr(LB.ID)
-            if not run.walk():
-                break
-        run.head()
+    # (nothing breaks between letters and numbers with combining marks, so
+    # that such a string, like a word, needs no rules to be tested)
+    if not legacy and _UNBREAKABLE.issuperset(run.attributes()):
+        return bytes([Breakable.DoNotBreak]) * len(s)
+
+    # look up the properties which the rules refer to once for each distinct
+    # non-ASCII character; ASCII ones, including 'A' which LB10 substitutes
+    # for, are looked up in advance
+    if s.isascii():
+        ambiguous, narrow, cats = _ASCII_AMBIGUOUS, _ASCII_NARROW, _ASCII_CATS
+    else:
+        ambiguous = _ASCII_AMBIGUOUS.copy()
+        narrow = _ASCII_NARROW.copy()
+        cats = _ASCII_CATS.copy()
+        for c in set(s).difference(cats):
+            ambiguous[c], narrow[c], cats[c] = _properties(c)
+
+    # (the legacy substitution is applied to each position just before the
+    # rules below see it as the current one)
+    if legacy and ambiguous[run.cc]:
+        run.set_attr(LB.ID)
     # LB2
     run.do_not_break_here()
+    # (the value before the spaces which precede the current position, kept
+    # up to date instead of scanning back over the spaces at every position)
+    before_sp = None
     while run.walk():
+        if legacy and ambiguous[run.cc]:
+            run.set_attr(LB.ID)
+        if run.prev != LB.SP:
+            before_sp = run.prev
         # LB4
         if run.prev == LB.BK:
             run.break_here()
         # LB5
         elif run.prev == LB.CR and run.curr == LB.LF:
             run.do_not_break_here()
-        elif run.prev in (LB.CR, LB.LF, LB.NL):
+        elif run.prev in NewlineTuple:
             run.break_here()
         # LB6
-        elif run.curr in (LB.BK, LB.CR, LB.LF, LB.NL):
+        elif run.curr in BreakTuple:
             run.do_not_break_here()
         # LB7
-        elif run.curr in (LB.SP, LB.ZW):
+        elif run.curr in SpaceTuple:
             run.do_not_break_here()
         # LB8
-        elif run.is_following(LB.SP, greedy=True).prev == LB.ZW:
+        elif before_sp == LB.ZW:
             run.break_here()
         # LB8a
         elif run.prev == LB.ZWJ:
             run.do_not_break_here()
-    # LB9
-    run.head()
-    skip_table = [1]
-    while run.walk():
-        if (
-            run.is_following((LB.CM, LB.ZWJ), greedy=True).prev not in (
-                LB.BK, LB.CR, LB.LF, LB.NL, LB.SP, LB.ZW)
-            and run.curr in (LB.CM, LB.ZWJ)
-
-        ):
-            skip_table.append(0)
-            run.do_not_break_here()
-        else:
-            skip_table.append(1)
-    run.set_skip_table(skip_table)
-    # LB10
-    run.head()
-    while 1:
-        if run.curr in (LB.CM, LB.ZWJ):
+    # (LB9 and LB10 have nothing to do unless there are CM or ZWJ)
+    if LB.CM in run or LB.ZWJ in run:
+        # LB9 and LB10 in a single pass; LB9 looks at the values before
+        # LB10 replaces them, which are kept in `prev`
+        run.head()
+        skip_table = bytearray([1]) * len(s)
+        prev = run.curr
+        # (the value before the CM and ZWJ which precede the current position)
+        before_cm = None
+        # LB10 (the first character never attaches to anything by LB9)
+        if prev in CombiningTuple:
             run.set_char('A')
             run.set_attr(LB.AL)
-        if not run.walk():
-            break
+        while run.walk():
+            curr = run.curr
+            if prev not in CombiningTuple:
+                before_cm = prev
+            if curr in CombiningTuple:
+                # LB9
+                if before_cm not in BreakSpaceTuple:
+                    skip_table[run.position] = 0
+                    run.do_not_break_here()
+                # LB10
+                else:
+                    run.set_char('A')
+                    run.set_attr(LB.AL)
+            prev = curr
+        run.set_skip_table(skip_table)
     run.head()
+    # (the values before the spaces, and before the infix separators, which
+    # precede the current position)
+    before_sp = before_infix = None
     while run.walk():
-        # LB11
-        if run.curr == LB.WJ or run.prev == LB.WJ:
-            run.do_not_break_here()
-        # LB12
-        elif run.prev == LB.GL:
-            run.do_not_break_here()
-        # LB12a
-        elif run.prev not in (LB.SP, LB.BA, LB.HY) and run.curr == LB.GL:
-            run.do_not_break_here()
-        # LB13
-        elif run.curr in (LB.CL, LB.CP, LB.EX, LB.SY):
+        if run.prev != LB.SP:
+            before_sp = run.prev
+        if run.prev not in InfixTuple:
+            before_infix = run.prev
+        # LB11, LB12, LB12a, LB13
+        if (run.prev, run.curr) in _LB11_LB13_PAIRS:
             run.do_not_break_here()
         # LB14
-        elif run.is_following(LB.SP, greedy=True).prev == LB.OP:
+        elif before_sp == LB.OP:
             run.do_not_break_here()
         # LB15a
         elif (
             (run0 := run.is_following(LB.SP, greedy=True))
-            and _cat(run0.pc) == GC.Pi
+            and cats[run0.pc] == GC.Pi
             and (
                 (run1 := run0.is_following(LB.QU))
-                .prev in (LB.BK, LB.CR, LB.LF, LB.NL, LB.OP,
-                          LB.QU, LB.GL, LB.SP, LB.ZW)
+                .prev in LB15aPrecedingTuple
                 or run1.is_sot()
             )
         ):
             run.do_not_break_here()
         # LB15b
         elif (
-            _cat(run.cc) == GC.Pf
+            cats[run.cc] == GC.Pf
             and run.curr == LB.QU
             and (
-                run.is_leading((
-                    LB.SP, LB.GL, LB.WJ, LB.CL, LB.QU, LB.CP, LB.EX,
-                    LB.IS, LB.SY, LB.BK, LB.CR, LB.LF, LB.NL, LB.ZW
-                ))
+                run.is_leading(LB15bFollowingTuple)
                 or run.is_eot()
             )
         ):
@@ -301,13 +423,13 @@ def line_break_breakables(s: str, /, legacy: bool = False) -> Breakables:
             run.do_not_break_here()
         # LB16
         elif (
-            run.is_following(LB.SP, greedy=True).prev in (LB.CL, LB.CP)
+            before_sp in CloseTuple
             and run.curr == LB.NS
         ):
             run.do_not_break_here()
         # LB17
         elif (
-            run.is_following(LB.SP, greedy=True).prev == LB.B2
+            before_sp == LB.B2
             and run.curr == LB.B2
         ):
             run.do_not_break_here()
@@ -316,26 +438,19 @@ def line_break_breakables(s: str, /, legacy: bool = False) -> Breakables:
             run.break_here()
         # LB19
         elif (
-            (run.curr == LB.QU and _cat(run.cc) != GC.Pi)
-            or (run.prev == LB.QU and _cat(run.pc) != GC.Pf)
+            (run.curr == LB.QU and cats[run.cc] != GC.Pi)
+            or (run.prev == LB.QU and cats[run.pc] != GC.Pf)
         ):
             run.do_not_break_here()
         # LB19a
         elif (
-            (
-                _ea(run.pc) not in EastAsianTuple and run.curr == LB.QU
-            )
-            or (
-                run.curr == LB.QU
-                and (_ea(run.nc) not in EastAsianTuple or run.is_eot())
-            )
+            (run.curr == LB.QU and narrow[run.pc])
+            or (run.curr == LB.QU and (narrow[run.nc] or run.is_eot()))
+            or (run.prev == LB.QU and narrow[run.cc])
             or (
                 run.prev == LB.QU
-                and _ea(run.cc) not in EastAsianTuple
-            )
-            or (
-                (run0 := run.is_following(LB.QU))
-                and (_ea(run0.pc) not in EastAsianTuple or run0.is_sot())
+                and (run0 := run.is_following(LB.QU))
+                and (narrow[run0.pc] or run0.is_sot())
             )
         ):
             run.do_not_break_here()
@@ -344,10 +459,9 @@ def line_break_breakables(s: str, /, legacy: bool = False) -> Breakables:
             run.break_here()
         # LB20a
         elif (
-            (run0 := run.is_following((LB.HY, LB.BA)))
+            (run0 := run.is_following(HyphenTuple))
             and (
-                run0.prev in (LB.BK, LB.CR, LB.LF, LB.NL,
-                              LB.SP, LB.ZW, LB.CB, LB.GL)
+                run0.prev in LB20aPrecedingTuple
                 or run0.is_sot()
             )
             and run.curr == LB.AL
@@ -355,146 +469,106 @@ def line_break_breakables(s: str, /, legacy: bool = False) -> Breakables:
         ):
             run.do_not_break_here()
         # LB21
-        elif run.curr in (LB.BA, LB.HY, LB.NS) or run.prev == LB.BB:
+        elif run.curr in LB21Tuple or run.prev == LB.BB:
             run.do_not_break_here()
         # LB21a
-        elif run.is_following((LB.HY, LB.BA)).prev == LB.HL and run.curr != LB.HL:
+        elif run.is_following(HyphenTuple).prev == LB.HL and run.curr != LB.HL:
             run.do_not_break_here()
-        # LB21b
-        elif run.prev == LB.SY and run.curr == LB.HL:
-            run.do_not_break_here()
-        # LB22
-        elif run.curr == LB.IN:
-            run.do_not_break_here()
-        # LB23
-        elif (
-            (run.prev in (LB.AL, LB.HL) and run.curr == LB.NU)
-            or (run.prev == LB.NU and run.curr in (LB.AL, LB.HL))
-        ):
-            run.do_not_break_here()
-        # LB23a
-        elif (
-            (run.prev == LB.PR and run.curr in (LB.ID, LB.EB, LB.EM))
-            or (run.prev in (LB.ID, LB.EB, LB.EM) and run.curr == LB.PO)
-        ):
-            run.do_not_break_here()
-        # LB24
-        elif (
-            (run.prev in (LB.PR, LB.PO) and run.curr in (LB.AL, LB.HL))
-            or (run.prev in (LB.AL, LB.HL) and run.curr in (LB.PR, LB.PO))
-        ):
+        # LB21b, LB22, LB23, LB23a, LB24
+        elif (run.prev, run.curr) in _LB21B_LB24_PAIRS:
             run.do_not_break_here()
         # LB25
         elif (
-            (run.is_following((LB.CL, LB.CP))
-             .is_following((LB.SY, LB.IS), greedy=True).prev == LB.NU
-             and run.curr in (LB.PO, LB.PR))
+            (run.curr in NumericAffixTuple
+             and run.is_following(CloseTuple)
+             .is_following(InfixTuple, greedy=True).prev == LB.NU)
             or (
-                run.is_following((LB.SY, LB.IS), greedy=True).prev == LB.NU
-                and run.curr in (LB.PO, LB.PR)
+                before_infix == LB.NU
+                and run.curr in NumericAffixTuple
             )
             or (
-                run.prev in (LB.PO, LB.PR)
+                run.prev in NumericAffixTuple
                 and run.curr == LB.OP
                 and run.next == LB.NU
             )
             or (
-                run.prev in (LB.PO, LB.PR)
+                run.prev in NumericAffixTuple
                 and run.curr == LB.OP
                 and run.next == LB.IS
                 and run.attr(2) == LB.NU
             )
-            or (run.prev in (LB.PO, LB.PR) and run.curr == LB.NU)
-            or (run.prev in (LB.HY, LB.IS) and run.curr == LB.NU)
-            or (
-                run.is_following((LB.SY, LB.IS), greedy=True).prev == LB.NU
-                and run.curr == LB.NU
-            )
-        ):
-            run.do_not_break_here()
-        # LB26
-        elif (
-            (run.prev == LB.JL and run.curr in (LB.JL, LB.JV, LB.H2, LB.H3))
-            or (run.prev in (LB.JV, LB.H2) and run.curr in (LB.JV, LB.JT))
-            or (run.prev in (LB.JT, LB.H3) and run.curr == LB.JT)
-        ):
-            run.do_not_break_here()
-        # LB27
-        elif (
-            (
-                run.prev in (LB.JL, LB.JV, LB.JT, LB.H2, LB.H3)
-                and run.curr == LB.PO
-            )
-            or (
-                run.prev == LB.PR
-                and run.curr in (LB.JL, LB.JV, LB.JT, LB.H2, LB.H3)
-            )
+            or (run.prev in NumericAffixTuple and run.curr == LB.NU)
+            or (run.prev in LB25PrecedingTuple and run.curr == LB.NU)
+            or (before_infix == LB.NU and run.curr == LB.NU)
         ):
             run.do_not_break_here()
-        # LB28
-        elif run.prev in (LB.AL, LB.HL) and run.curr in (LB.AL, LB.HL):
+        # LB26, LB27, LB28
+        elif (run.prev, run.curr) in _LB26_LB28_PAIRS:
             run.do_not_break_here()
         # LB28a
         elif (
             (
                 run.prev == LB.AP
-                and (run.curr in (LB.AK, LB.AS) or run.cc == '\u25cc')
+                and (run.curr in AksaraTuple or run.cc == '\u25cc')
             )
             or (
-                (run.prev in (LB.AK, LB.AS) or run.pc == '\u25cc')
-                and run.curr in (LB.VF, LB.VI)
+                (run.prev in AksaraTuple or run.pc == '\u25cc')
+                and run.curr in ViramaTuple
             )
             or (
-                (run.attr(-2) in (LB.AK, LB.AS) or run.char(-2) == '\u25cc')
+                (run.attr(-2) in AksaraTuple or run.char(-2) == '\u25cc')
                 and run.prev == LB.VI
                 and (run.curr == LB.AK or run.cc == '\u25cc')
             )
             or (
-                (run.prev in (LB.AK, LB.AS) or run.pc == '\u25cc')
-                and (run.curr in (LB.AK, LB.AS) or run.cc == '\u25cc')
+                (run.prev in AksaraTuple or run.pc == '\u25cc')
+                and (run.curr in AksaraTuple or run.cc == '\u25cc')
                 and run.next == LB.VF
             )
         ):
             run.do_not_break_here()
         # LB29
-        elif run.prev == LB.IS and run.curr in (LB.AL, LB.HL):
+        elif run.prev == LB.IS and run.curr in AlphabeticTuple:
             run.do_not_break_here()
         # LB30
         elif (
             (
-                run.prev in (LB.AL, LB.HL, LB.NU)
+                run.prev in AlphaNumericTuple
                 and run.curr == LB.OP
-                and _ea(run.cc) not in EastAsianTuple
+                and narrow[run.cc]
             )
             or (
                 run.prev == LB.CP
-                and _ea(run.pc) not in EastAsianTuple
-                and run.curr in (LB.AL, LB.HL, LB.NU)
+                and narrow[run.pc]
+                and run.curr in AlphaNumericTuple
             )
         ):
             run.do_not_break_here()
+        # LB30b
+        # (look up the properties of the previous character only before EM;
+        # LB30a below never decides a position before EM, so that this rule
+        # can be tested in the same pass)
+        elif run.curr == LB.EM and (
+            run.prev == LB.EB
+            or (_extpict(run.pc) and cats[run.pc] == GC.Cn)
+        ):
+            run.do_not_break_here()
     # LB30a
     run.head()
-    while 1:
-        while run.curr != LB.RI:
-            if not run.walk():
-                break
-        if not run.walk():
-            break
-        while run.prev == run.curr == LB.RI:
-            run.do_not_break_here()
-            if not run.walk():
-                break
+    # (nothing to do unless there are regional indicators)
+    if LB.RI in run:
+        while 1:
+            while run.curr != LB.RI:
+                if not run.walk():
+                    break
             if not run.walk():
                 break
-    # LB30b
-    run.head()
-    while run.walk():
-        if (
-            (run.prev == LB.EB and run.curr == LB.EM)
-            or (_cat(run.pc) == GC.Cn and _extpict(run.pc) and run.curr == LB.EM)
-        ):
-            run.do_not_break_here()
+            while run.prev == run.curr == LB.RI:
+                run.do_not_break_here()
+                if not run.walk():
+                    break
+                if not run.walk():
+                    break
     # LB31
     run.set_default(Breakable.Break)
     return run.literal_breakables()
@@ -7,12 +7,13 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from functools import lru_cache
 from typing import Optional
 
 from uniseg import Unicode_Property
-from uniseg.breaking import (Breakable, Breakables, Run, TailorBreakables, boundaries,
-                             break_units)
-from uniseg.db import get_handle, get_value
+from uniseg.breaking import (Breakable, Breakables, Run, TailorBreakables,
+                             _cache_short_strings, boundaries, break_units)
+from uniseg.db import get_column, get_handle, get_index
 
 __all__ = [
     'Sentence_Break',
@@ -66,8 +67,22 @@ SB = Sentence_Break
 
 ParaSepTuple = (SB.Sep, SB.CR, SB.LF)
 SATermTuple = (SB.STerm, SB.ATerm)
+UpperLowerTuple = (SB.Upper, SB.Lower)
+SB8Tuple = (SB.Extend, SB.Format, SB.Sp, SB.Numeric, SB.SContinue, SB.Close)
+SB8aTuple = (SB.SContinue,) + SATermTuple
+SB9Tuple = (SB.Close, SB.Sp) + ParaSepTuple
+SB10Tuple = (SB.Sp,) + ParaSepTuple
+# values after which SB4 and SB11 break in the middle of the text
+_TERMINATORS = frozenset(SATermTuple + ParaSepTuple)
 
 
+# property values indexed by the value index of the database
+_SB_TABLE = tuple(
+    Sentence_Break[x or 'Other'] for x in get_column(H_SENTENCE_BREAK)
+)
+
+
+@lru_cache(maxsize=1024)
 def sentence_break(c: str, /) -> Sentence_Break:
     R"""Return Sentence_Break property value of `c`.
 
@@ -82,7 +97,7 @@ def sentence_break(c: str, /) -> Sentence_Break:
     >>> sentence_break('/')
     Sentence_Break.Other
     """
-    return Sentence_Break[get_value(H_SENTENCE_BREAK, ord(c)) or 'Other']
+    return _SB_TABLE[get_index(ord(c))]
 
 
 def sentence_breakables(s: str, /) -> Breakables:
@@ -98,9 +113,18 @@ def sentence_breakables(s: str, /) -> Breakables:
     [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
      0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
     """
+    return _sentence_breakables(s)
+
+
+@_cache_short_strings
+def _sentence_breakables(s: str, /) -> Breakables:
     run = Run(s, sentence_break)
     # SB1
     run.break_here()
+    # (only the rules after terminators and separators break in the middle
+    # of the text)
+    if _TERMINATORS.isdisjoint(run.attributes()):
+        return bytes([Breakable.Break]) + bytes(len(s) - 1) if s else b''
     while run.walk():
         # SB3
         if run.prev == SB.CR and run.curr == SB.LF:
@@ -109,30 +133,34 @@ def sentence_breakables(s: str, /) -> Breakables:
         elif run.prev in ParaSepTuple:
             run.break_here()
     # SB5
-    run.set_skip_table(x not in (SB.Extend, SB.Format)
-                       for x in run.attributes())
+    run.skip((SB.Extend, SB.Format))
     run.head()
+    # (the values before the Close characters, and before the Close and Sp
+    # characters in this order, which precede the current position, kept up
+    # to date instead of scanning back over them at every position)
+    before_close = before_sp_close = None
     while run.walk():
+        if run.prev != SB.Close:
+            before_close = run.prev
+        if run.prev != SB.Sp:
+            before_sp_close = before_close
         # SB6
         if run.prev == SB.ATerm and run.curr == SB.Numeric:
             run.do_not_break_here()
         # SB7
         elif (
-            run.attr(-2) in (SB.Upper, SB.Lower)
+            run.attr(-2) in UpperLowerTuple
             and run.prev == SB.ATerm
             and run.curr == SB.Upper
         ):
             run.do_not_break_here()
         # SB8
         elif (
-            run.is_following(SB.Sp, greedy=True)
-            .is_following(SB.Close, greedy=True).prev == SB.ATerm
+            before_sp_close == SB.ATerm
             and (
                 (
-                    run.curr in (SB.Extend, SB.Format, SB.Sp,
-                                 SB.Numeric, SB.SContinue, SB.Close)
-                    and run.is_leading((SB.Extend, SB.Format, SB.Sp, SB.Numeric,
-                                        SB.SContinue, SB.Close), greedy=True)
+                    run.curr in SB8Tuple
+                    and run.is_leading(SB8Tuple, greedy=True)
                     .next == SB.Lower
                 )
                 or run.curr == SB.Lower
@@ -141,28 +169,25 @@ def sentence_breakables(s: str, /) -> Breakables:
             run.do_not_break_here()
         # SB8a
         elif (
-            run.is_following(SB.Sp, greedy=True)
-            .is_following(SB.Close, greedy=True).prev in SATermTuple
-            and run.curr in (SB.SContinue,) + SATermTuple
+            before_sp_close in SATermTuple
+            and run.curr in SB8aTuple
         ):
             run.do_not_break_here()
         # SB9
         elif (
-            run.is_following(SB.Close, greedy=True).prev in SATermTuple
-            and run.curr in (SB.Close, SB.Sp) + ParaSepTuple
+            before_close in SATermTuple
+            and run.curr in SB9Tuple
         ):
             run.do_not_break_here()
         # SB10
         elif (
-            run.is_following(SB.Sp, greedy=True)
-            .is_following(SB.Close, greedy=True).prev in SATermTuple
-            and run.curr in (SB.Sp,) + ParaSepTuple
+            before_sp_close in SATermTuple
+            and run.curr in SB10Tuple
         ):
             run.do_not_break_here()
         # SB11
         elif (
-            run.is_following(SB.Sp, greedy=True)
-            .is_following(SB.Close, greedy=True).prev in SATermTuple
+            before_sp_close in SATermTuple
             or run.is_following(ParaSepTuple, noskip=True)
             .is_following(SB.Sp, greedy=True)
             .is_following(SB.Close, greedy=True).prev in SATermTuple
@@ -4,12 +4,15 @@
 <https://www.unicode.org/reports/tr29/tr29-45.html>`_
 """
 
-from typing import Iterator, Optional
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
 
 from uniseg import Unicode_Property
 from uniseg.breaking import (Breakable, Breakables, Run, TailorBreakables, boundaries,
                              break_units)
-from uniseg.db import get_handle, get_value
+from uniseg.db import get_column, get_handle, get_index
 from uniseg.emoji import extended_pictographic
 
 __all__ = [
@@ -72,8 +75,62 @@ WB = Word_Break
 
 AHLetterTuple = (WB.ALetter, WB.Hebrew_Letter)
 MidNumLetQTuple = (WB.MidNumLet, WB.Single_Quote)
+MidLetterQTuple = (WB.MidLetter,) + MidNumLetQTuple
+MidNumQTuple = (WB.MidNum,) + MidNumLetQTuple
+NewlineTuple = (WB.Newline, WB.CR, WB.LF)
+IgnoreTuple = (WB.Extend, WB.Format, WB.ZWJ)
+
+
+def _pairs(
+    prevs: Iterable[Word_Break], currs: Iterable[Word_Break], /
+) -> frozenset[tuple[Word_Break, Word_Break]]:
+    return frozenset((p, c) for p in prevs for c in currs)
+
+
+# pairs of the previous and the current values which the rules from WB5 to
+# WB13b decide "do not break" by themselves; since all of these rules decide
+# "do not break", they are tested in any order
+_WB5_WB13B_PAIRS = (
+    # WB5
+    _pairs(AHLetterTuple, AHLetterTuple)
+    # WB7a
+    | _pairs((WB.Hebrew_Letter,), (WB.Single_Quote,))
+    # WB8, WB9, WB10
+    | _pairs(AHLetterTuple + (WB.Numeric,), (WB.Numeric,))
+    | _pairs((WB.Numeric,), AHLetterTuple)
+    # WB13
+    | _pairs((WB.Katakana,), (WB.Katakana,))
+    # WB13a
+    | _pairs(AHLetterTuple + (WB.Numeric, WB.Katakana, WB.ExtendNumLet),
+             (WB.ExtendNumLet,))
+    # WB13b
+    | _pairs((WB.ExtendNumLet,), AHLetterTuple + (WB.Numeric, WB.Katakana))
+)
+# pairs for which the rules from WB6 to WB12 which look beyond the pair can
+# decide "do not break"
+_WB6_WB12_PAIRS = (
+    # WB6
+    _pairs(AHLetterTuple, MidLetterQTuple)
+    # WB7
+    | _pairs(MidLetterQTuple, AHLetterTuple)
+    # WB7b
+    | _pairs((WB.Hebrew_Letter,), (WB.Double_Quote,))
+    # WB7c
+    | _pairs((WB.Double_Quote,), (WB.Hebrew_Letter,))
+    # WB11
+    | _pairs(MidNumQTuple, (WB.Numeric,))
+    # WB12
+    | _pairs((WB.Numeric,), MidNumQTuple)
+)
 
 
+# property values indexed by the value index of the database
+_WB_TABLE = tuple(
+    Word_Break[x or 'Other'] for x in get_column(H_WORD_BREAK)
+)
+
+
+@lru_cache(maxsize=1024)
 def word_break(c: str, /) -> Word_Break:
     R"""Return the Word_Break property of `c`
 
@@ -86,7 +143,61 @@ def word_break(c: str, /) -> Word_Break:
     >>> word_break('ア')
     Word_Break.Katakana
     """
-    return Word_Break[get_value(H_WORD_BREAK, ord(c)) or 'Other']
+    return _WB_TABLE[get_index(ord(c))]
+
+
+# property values of the ASCII characters, indexed by the code point
+_ASCII_WORD_BREAKS = tuple(word_break(chr(i)) for i in range(0x80))
+
+
+def _word_breakables_ascii(s: str, /) -> bytes:
+    """(internal) Return the word breaking opportunities of the non-empty
+    ASCII string `s`.
+
+    No ASCII character is Extend, Format, ZWJ, Regional_Indicator,
+    Katakana, Hebrew_Letter nor Extended_Pictographic, so that the rules
+    WB3c, WB4, WB7a-WB7c, WB13 and WB15-WB16 never apply.
+
+    >>> list(_word_breakables_ascii("can't 3.14, a.b"))
+    [1, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 1, 1, 0, 0]
+    """
+    values = [_ASCII_WORD_BREAKS[x] for x in s.encode('ascii')]
+    length = len(values)
+    breakables = bytearray([Breakable.Break]) * length
+    for i in range(1, length):
+        prev = values[i - 1]
+        curr = values[i]
+        # WB3
+        if prev == WB.CR and curr == WB.LF:
+            breakables[i] = Breakable.DoNotBreak
+        # WB3a, WB3b
+        elif prev in NewlineTuple or curr in NewlineTuple:
+            pass
+        # WB3d
+        elif prev == curr == WB.WSegSpace:
+            breakables[i] = Breakable.DoNotBreak
+        # WB5, WB8, WB9, WB10, WB13a, WB13b
+        elif (pair := (prev, curr)) in _WB5_WB13B_PAIRS:
+            breakables[i] = Breakable.DoNotBreak
+        elif pair not in _WB6_WB12_PAIRS:
+            pass
+        # (the pair tells which one of the rules below can apply)
+        # WB6
+        elif prev in AHLetterTuple:
+            if i + 1 < length and values[i + 1] in AHLetterTuple:
+                breakables[i] = Breakable.DoNotBreak
+        # WB7
+        elif curr in AHLetterTuple:
+            if 2 <= i and values[i - 2] in AHLetterTuple:
+                breakables[i] = Breakable.DoNotBreak
+        # WB11
+        elif curr == WB.Numeric:
+            if 2 <= i and values[i - 2] == WB.Numeric:
+                breakables[i] = Breakable.DoNotBreak
+        # WB12
+        elif i + 1 < length and values[i + 1] == WB.Numeric:
+            breakables[i] = Breakable.DoNotBreak
+    return bytes(breakables)
 
 
 def word_breakables(s: str, /) -> Breakables:
@@ -103,53 +214,55 @@ def word_breakables(s: str, /) -> Breakables:
     [1, 0, 1]
     """
     if not s:
-        return iter([])
+        return b''
+    if s.isascii():
+        return _word_breakables_ascii(s)
 
     run = Run(s, word_break)
-    while run.walk():
+    # WB4 (the rules after WB4 see the values skipping these ones)
+    run.skip(IgnoreTuple)
+    # (all the rules are tested in a single walk over every position; the
+    # rules up to WB4 look at the neighbors without skipping)
+    while run.walk(noskip=True):
+        prev = run.attr(-1, noskip=True)
         # WB3
-        if run.prev == WB.CR and run.curr == WB.LF:
+        if prev == WB.CR and run.curr == WB.LF:
             run.do_not_break_here()
         # WB3a
-        elif run.prev in (WB.Newline, WB.CR, WB.LF):
+        elif prev in NewlineTuple:
             run.break_here()
         # WB3b
-        elif run.curr in (WB.Newline, WB.CR, WB.LF):
+        elif run.curr in NewlineTuple:
             run.break_here()
         # WB3c
-        elif run.prev == WB.ZWJ and run.cc and extended_pictographic(run.cc):
+        elif prev == WB.ZWJ and run.cc and extended_pictographic(run.cc):
             run.do_not_break_here()
         # WB3d
-        elif run.prev == run.curr == WB.WSegSpace:
+        elif prev == run.curr == WB.WSegSpace:
             run.do_not_break_here()
         # WB4
-        elif run.curr in (WB.Format, WB.Extend, WB.ZWJ):
+        elif run.curr in IgnoreTuple:
             run.do_not_break_here()
-    # WB4
-    run.set_skip_table(x not in (WB.Extend, WB.Format, WB.ZWJ)
-                       for x in run.attributes())
-    run.head()
-    while run.walk():
-        # WB5
-        if run.prev in AHLetterTuple and run.curr in AHLetterTuple:
+        # WB5, WB7a, WB8, WB9, WB10, WB13, WB13a, WB13b
+        elif (pair := (run.prev, run.curr)) in _WB5_WB13B_PAIRS:
             run.do_not_break_here()
+        # (the rules below look beyond the pair, only for some of the pairs)
+        elif pair not in _WB6_WB12_PAIRS:
+            pass
         # WB6
         elif (
             run.prev in AHLetterTuple
-            and run.curr in (WB.MidLetter,) + MidNumLetQTuple
+            and run.curr in MidLetterQTuple
             and run.next in AHLetterTuple
         ):
             run.do_not_break_here()
         # WB7
         elif (
             run.attr(-2) in AHLetterTuple
-            and run.prev in (WB.MidLetter,) + MidNumLetQTuple
+            and run.prev in MidLetterQTuple
             and run.curr in AHLetterTuple
         ):
             run.do_not_break_here()
-        # WB7a
-        elif run.prev == WB.Hebrew_Letter and run.curr == WB.Single_Quote:
-            run.do_not_break_here()
         # WB7b
         elif (
             run.prev == WB.Hebrew_Letter
@@ -164,58 +277,36 @@ def word_breakables(s: str, /) -> Breakables:
             and run.curr == WB.Hebrew_Letter
         ):
             run.do_not_break_here()
-        # WB8
-        elif run.prev == run.curr == WB.Numeric:
-            run.do_not_break_here()
-        # WB9
-        elif run.prev in AHLetterTuple and run.curr == WB.Numeric:
-            run.do_not_break_here()
-        # WB10
-        elif run.prev == WB.Numeric and run.curr in AHLetterTuple:
-            run.do_not_break_here()
         # WB11
         elif (
             run.attr(-2) == WB.Numeric
-            and run.prev in (WB.MidNum,) + MidNumLetQTuple
+            and run.prev in MidNumQTuple
             and run.curr == WB.Numeric
         ):
             run.do_not_break_here()
         # WB12
         elif (
             run.prev == WB.Numeric
-            and run.curr in (WB.MidNum,) + MidNumLetQTuple
+            and run.curr in MidNumQTuple
             and run.next == WB.Numeric
         ):
             run.do_not_break_here()
-        # WB13
-        elif run.prev == run.curr == WB.Katakana:
-            run.do_not_break_here()
-        # WB13a
-        elif (
-            run.prev in AHLetterTuple + (WB.Numeric, WB.Katakana, WB.ExtendNumLet)
-            and run.curr == WB.ExtendNumLet
-        ):
-            run.do_not_break_here()
-        # WB13b
-        elif (
-            run.prev == WB.ExtendNumLet
-            and run.curr in AHLetterTuple + (WB.Numeric, WB.Katakana)
-        ):
-            run.do_not_break_here()
     run.head()
     # WB15, WB16
-    while 1:
-        while run.curr != WB.Regional_Indicator:
-            if not run.walk():
-                break
-        if not run.walk():
-            break
-        while run.prev == run.curr == WB.Regional_Indicator:
-            run.do_not_break_here()
-            if not run.walk():
-                break
+    # (nothing to do unless there are regional indicators)
+    if WB.Regional_Indicator in run:
+        while 1:
+            while run.curr != WB.Regional_Indicator:
+                if not run.walk():
+                    break
             if not run.walk():
                 break
+            while run.prev == run.curr == WB.Regional_Indicator:
+                run.do_not_break_here()
+                if not run.walk():
+                    break
+                if not run.walk():
+                    break
     # WB999
     run.set_default(Breakable.Break)
     return run.literal_breakables()
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Iterator, Sequence
 from typing import Optional, Protocol
 
-from uniseg.breaking import TailorBreakables
+from uniseg.breaking import TailorBreakables, _cache_short_strings
 from uniseg.graphemecluster import grapheme_cluster_boundaries, grapheme_clusters
 from uniseg.linebreak import line_break_boundaries
 from uniseg.unicodedata_ import EA, east_asian_width_
@@ -134,6 +134,9 @@ class Wrapper:
     def _expand_tabs(
         s: str, extents: list[int], /, tab_width: int, offset: int = 0
     ) -> list[int]:
+        if '\t' not in s:
+            # nothing to expand; the same as copying `extents`
+            return list(extents)
         # expand tabs
         expanded_extens = []
         gap = 0
@@ -239,6 +242,9 @@ class TTFormatter:
         """Handler which is invoked when a text should be put on the current
         position.
         """
+        if '\t' not in text:
+            self._lines[-1] += text
+            return
         chars: list[str] = []
         prev_extent = 0
         for c, extent in zip(text, extents):
@@ -314,12 +320,18 @@ def tt_text_extents(s: str, /, *, ambiguous_as_wide: bool = False) -> list[int]:
     >>> tt_text_extents('αβ', ambiguous_as_wide=True)
     [2, 4]
     """
+    # (a new list for every call, since the caller may modify it)
+    return list(_tt_text_extents(s, ambiguous_as_wide))
+
+
+@_cache_short_strings
+def _tt_text_extents(s: str, ambiguous_as_wide: bool, /) -> tuple[int, ...]:
     widths: list[int] = []
     total_width = 0
     for g in grapheme_clusters(s):
         total_width += tt_width(g, ambiguous_as_wide=ambiguous_as_wide)
         widths.extend(total_width for __ in g)
-    return widths
+    return tuple(widths)
 
 
 def tt_wrap(
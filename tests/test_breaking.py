@@ -0,0 +1,34 @@
+from uniseg.breaking import Breakable, Run
+
+
+def test_set_default_001() -> None:
+    run = Run('abc')
+    run.walk()
+    run.do_not_break_here()
+    run.set_default(Breakable.Break)
+    expect = [Breakable.Break, Breakable.DoNotBreak, Breakable.Break]
+    assert expect == run.breakables()
+
+
+def test_set_default_002() -> None:
+    # runs returned by is_following() share the breakables
+    run = Run('abc')
+    run.walk()
+    run.do_not_break_here()
+    view = run.is_following('a')
+    assert view
+    run.set_default(Breakable.Break)
+    expect = [Breakable.Break, Breakable.DoNotBreak, Breakable.Break]
+    assert expect == view.breakables()
+
+
+def test_set_default_003() -> None:
+    # runs returned by is_leading() share the breakables
+    run = Run('abc')
+    run.walk()
+    view = run.is_leading('c')
+    assert view
+    view.do_not_break_here()
+    view.set_default(Breakable.Break)
+    expect = [Breakable.Break, Breakable.Break, Breakable.DoNotBreak]
+    assert expect == run.breakables()
@@ -0,0 +1,149 @@
+from uniseg.graphemecluster import grapheme_cluster_breakables
+
+
+def test_gb9c_001() -> None:
+    # KA + VIRAMA + SSA
+    actual = list(grapheme_cluster_breakables('\u0915\u094d\u0937'))
+    expect = [1, 0, 0]
+    assert expect == actual
+
+
+def test_gb9c_002() -> None:
+    # KA + VIRAMA + ZWJ + SSA
+    actual = list(grapheme_cluster_breakables('\u0915\u094d\u200d\u0937'))
+    expect = [1, 0, 0, 0]
+    assert expect == actual
+
+
+def test_gb9c_003() -> None:
+    # KA + VIRAMA + VIRAMA + SSA + VIRAMA + RA
+    actual = list(
+        grapheme_cluster_breakables('\u0915\u094d\u094d\u0937\u094d\u0930')
+    )
+    expect = [1, 0, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_gb9c_004() -> None:
+    # KA + VIRAMA + LATIN SMALL LETTER A
+    actual = list(grapheme_cluster_breakables('\u0915\u094da'))
+    expect = [1, 0, 1]
+    assert expect == actual
+
+
+def test_gb9c_005() -> None:
+    # KA + VOWEL SIGN I + VIRAMA + SSA
+    actual = list(grapheme_cluster_breakables('\u0915\u093f\u094d\u0937'))
+    expect = [1, 0, 0, 1]
+    assert expect == actual
+
+
+def test_ri_001() -> None:
+    actual = list(grapheme_cluster_breakables('\U0001f1ef\U0001f1f5'))
+    expect = [1, 0]
+    assert expect == actual
+
+
+def test_ri_002() -> None:
+    actual = list(
+        grapheme_cluster_breakables('\U0001f1ef\U0001f1f5\U0001f1fa')
+    )
+    expect = [1, 0, 1]
+    assert expect == actual
+
+
+def test_ri_003() -> None:
+    actual = list(
+        grapheme_cluster_breakables(
+            '\U0001f1ef\U0001f1f5\U0001f1fa\U0001f1f8'
+        )
+    )
+    expect = [1, 0, 1, 0]
+    assert expect == actual
+
+
+def test_ri_004() -> None:
+    actual = list(
+        grapheme_cluster_breakables('a\U0001f1ef\U0001f1f5\U0001f1fa')
+    )
+    expect = [1, 1, 0, 1]
+    assert expect == actual
+
+
+def test_zwj_001() -> None:
+    actual = list(grapheme_cluster_breakables('\U0001f468\u200d\U0001f469'))
+    expect = [1, 0, 0]
+    assert expect == actual
+
+
+def test_zwj_002() -> None:
+    actual = list(
+        grapheme_cluster_breakables('\U0001f468\u0308\u200d\U0001f469')
+    )
+    expect = [1, 0, 0, 0]
+    assert expect == actual
+
+
+def test_zwj_003() -> None:
+    actual = list(grapheme_cluster_breakables('a\u200d\U0001f469'))
+    expect = [1, 0, 1]
+    assert expect == actual
+
+
+def test_zwj_004() -> None:
+    actual = list(grapheme_cluster_breakables('\u200d\U0001f469'))
+    expect = [1, 1]
+    assert expect == actual
+
+
+def test_crlf_001() -> None:
+    actual = list(grapheme_cluster_breakables('a\r\nb'))
+    expect = [1, 1, 0, 1]
+    assert expect == actual
+
+
+def test_crlf_002() -> None:
+    actual = list(grapheme_cluster_breakables('\r\r\n\n'))
+    expect = [1, 1, 0, 1]
+    assert expect == actual
+
+
+def test_crlf_003() -> None:
+    actual = list(grapheme_cluster_breakables('ab\r\n\r\ncd\n\r'))
+    expect = [1, 1, 1, 0, 1, 0, 1, 1, 1, 1]
+    assert expect == actual
+
+
+def test_simple_special_001() -> None:
+    actual = list(grapheme_cluster_breakables('e\u0301x'))
+    expect = [1, 0, 1]
+    assert expect == actual
+
+
+def test_simple_special_002() -> None:
+    # Hangul L V T in the middle of the text
+    actual = list(grapheme_cluster_breakables('e\u0301\u1100\u1161\u11a8x'))
+    expect = [1, 0, 1, 0, 0, 1]
+    assert expect == actual
+
+
+def test_simple_special_003() -> None:
+    # Hangul LV syllable + T at the start of the text
+    actual = list(grapheme_cluster_breakables('\uac01\u11a8e\u0301'))
+    expect = [1, 0, 1, 0]
+    assert expect == actual
+
+
+def test_simple_special_004() -> None:
+    # Prepend at the start of the text
+    actual = list(grapheme_cluster_breakables('\u0600ae\u0301'))
+    expect = [1, 0, 1, 0]
+    assert expect == actual
+
+
+def test_simple_special_005() -> None:
+    actual = list(
+        grapheme_cluster_breakables('e\u0301\U0001f1ef\U0001f1f5e\u0301')
+    )
+    expect = [1, 0, 1, 0, 1, 0]
+    assert expect == actual
@@ -0,0 +1,99 @@
+from uniseg.linebreak import line_break_breakables
+
+
+def test_lb14_001() -> None:
+    actual = list(line_break_breakables('(        a'))
+    expect = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_lb16_001() -> None:
+    actual = list(line_break_breakables(')        \u203c'))
+    expect = [0, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+    assert expect == actual
+
+
+def test_lb17_001() -> None:
+    actual = list(line_break_breakables('\u2014        \u2014'))
+    expect = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_lb17_002() -> None:
+    actual = list(line_break_breakables('a        \u2014'))
+    expect = [0, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+    assert expect == actual
+
+
+def test_lb25_001() -> None:
+    actual = list(line_break_breakables('a $(1,234.5)% b'))
+    expect = [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+    assert expect == actual
+
+
+def test_lb25_002() -> None:
+    actual = list(line_break_breakables('x ($12.50) y'))
+    expect = [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+    assert expect == actual
+
+
+def test_lb25_003() -> None:
+    actual = list(line_break_breakables('a 1/2/3 b'))
+    expect = [0, 0, 1, 0, 0, 0, 0, 0, 1]
+    assert expect == actual
+
+
+def test_cm_001() -> None:
+    # CM at the start of the text
+    actual = list(line_break_breakables('\u0308a'))
+    expect = [0, 0]
+    assert expect == actual
+
+
+def test_cm_002() -> None:
+    actual = list(line_break_breakables('\u0308 a'))
+    expect = [0, 0, 1]
+    assert expect == actual
+
+
+def test_cm_003() -> None:
+    # CM at the end of an alphanumeric text
+    actual = list(line_break_breakables('abc123\u0308'))
+    expect = [0, 0, 0, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_cm_004() -> None:
+    actual = list(line_break_breakables('abc 123\u0308 x'))
+    expect = [0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+    assert expect == actual
+
+
+def test_legacy_001() -> None:
+    actual = list(line_break_breakables('\u2014        \u2014', legacy=True))
+    expect = [0, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+    assert expect == actual
+
+
+def test_legacy_002() -> None:
+    actual = list(line_break_breakables('\u0308a', legacy=True))
+    expect = [0, 1]
+    assert expect == actual
+
+
+def test_legacy_003() -> None:
+    actual = list(line_break_breakables('abc123\u0308', legacy=True))
+    expect = [0, 0, 0, 0, 0, 0, 1]
+    assert expect == actual
+
+
+def test_legacy_004() -> None:
+    actual = list(line_break_breakables('abc 123\u0308 x', legacy=True))
+    expect = [0, 0, 0, 0, 1, 0, 0, 1, 0, 1]
+    assert expect == actual
+
+
+def test_legacy_005() -> None:
+    actual = list(line_break_breakables('a $(1,234.5)% b', legacy=True))
+    expect = [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]
+    assert expect == actual
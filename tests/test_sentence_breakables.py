@@ -0,0 +1,40 @@
+from uniseg.sentencebreak import sentence_breakables
+
+
+def test_sb8_001() -> None:
+    # no break before a lowercase letter after Close Sp
+    actual = list(sentence_breakables('etc.)  the end.'))
+    expect = [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_sb11_001() -> None:
+    actual = list(sentence_breakables('Hi.)"  Bye.'))
+    expect = [1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0]
+    assert expect == actual
+
+
+def test_sb11_002() -> None:
+    # ParaSep after Close Sp
+    actual = list(sentence_breakables('Hi.)"  \u2029Bye.'))
+    expect = [1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0]
+    assert expect == actual
+
+
+def test_sb11_003() -> None:
+    actual = list(sentence_breakables('Hi.)\n\nBye.'))
+    expect = [1, 0, 0, 0, 0, 1, 1, 0, 0, 0]
+    assert expect == actual
+
+
+def test_no_terminator_001() -> None:
+    actual = list(sentence_breakables('hello world'))
+    expect = [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_no_terminator_002() -> None:
+    # ParaSep without any STerm or ATerm
+    actual = list(sentence_breakables('hello\u2029world'))
+    expect = [1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0]
+    assert expect == actual
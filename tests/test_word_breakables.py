@@ -0,0 +1,91 @@
+from uniseg.wordbreak import word_breakables
+
+
+def test_wb4_001() -> None:
+    # WB6/WB7 across Extend
+    actual = list(word_breakables('a\u0308.b'))
+    expect = [1, 0, 0, 0]
+    assert expect == actual
+
+
+def test_wb4_002() -> None:
+    # WB6/WB7 across Format on both sides of MidNumLetQ
+    actual = list(word_breakables('a\u00ad\'\u00adb'))
+    expect = [1, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_wb4_003() -> None:
+    # WB11/WB12 across Extend and Format
+    actual = list(word_breakables('3\u0308,\u20604'))
+    expect = [1, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_wb4_004() -> None:
+    # no ALetter after MidNumLet + Extend
+    actual = list(word_breakables('a.\u0308 '))
+    expect = [1, 1, 0, 1]
+    assert expect == actual
+
+
+def test_wb4_005() -> None:
+    actual = list(word_breakables('a\u0308.\u0308b\u0308'))
+    expect = [1, 0, 0, 0, 0, 0]
+    assert expect == actual
+
+
+def test_wb4_006() -> None:
+    # WB11/WB12 require Numeric on both sides
+    actual = list(word_breakables('1\u0308.\u0308a'))
+    expect = [1, 0, 1, 0, 1]
+    assert expect == actual
+
+
+def test_wb3c_001() -> None:
+    actual = list(word_breakables(' \u200d\U0001f6d1'))
+    expect = [1, 0, 1]
+    assert expect == actual
+
+
+def test_wb3c_002() -> None:
+    actual = list(word_breakables('\U0001f6d1\u200d\U0001f6d1'))
+    expect = [1, 0, 1]
+    assert expect == actual
+
+
+def test_wb3c_003() -> None:
+    actual = list(word_breakables('a\u200d\U0001f6d1'))
+    expect = [1, 0, 1]
+    assert expect == actual
+
+
+def test_ascii_001() -> None:
+    # non-ASCII ALetter in place of an ASCII one
+    text = 'Hello, world. It\'s 3.14 or 1,000 e.g. ok'
+    actual = list(word_breakables(text.replace('e', '\u00e9')))
+    expect = list(word_breakables(text))
+    assert expect == actual
+
+
+def test_ascii_002() -> None:
+    # non-ASCII Numeric in place of an ASCII one
+    text = 'can\'t stop; 42nd st.\r\n next_line a.b.c 1.e2'
+    actual = list(word_breakables(text.replace('1', '\u0661')))
+    expect = list(word_breakables(text))
+    assert expect == actual
+
+
+def test_ascii_003() -> None:
+    text = 'x = y + 12 - 3.5e'
+    actual = list(
+        word_breakables(text.replace('e', '\u00e9').replace('3', '\u0663'))
+    )
+    expect = list(word_breakables(text))
+    assert expect == actual
+
+
+def test_empty_001() -> None:
+    actual = word_breakables('')
+    expect = b''
+    assert expect == actual
@@ -10,6 +10,9 @@ from typing import NamedTuple, TextIO
 
 from ucdtools import iter_records
 
+# a rule step of the test comment, which starts with a break mark
+_RULE_STEP_PATTERN = re.compile(r'[\u00f7\u00d7][^\u00f7\u00d7]+')
+
 
 class Entry(NamedTuple):
     """Data class for test record."""
@@ -25,16 +28,14 @@ def parse_breaking_test_pattern(pattern: str) -> tuple[str, list[int]]:
     DONT_BREAK = '\u00d7'
     codepoints: list[str] = []
     breakpoints: list[int] = []
-    index = 0
     for token in pattern.split():
         if token == BREAK:
-            breakpoints.append(index)
+            # (every code point is a single item of the string)
+            breakpoints.append(len(codepoints))
         elif token == DONT_BREAK:
             pass
         else:
-            c = chr(int(token, 16))
-            codepoints.append(c)
-            index += len(c)
+            codepoints.append(chr(int(token, 16)))
     return ''.join(codepoints), breakpoints
 
 
@@ -52,7 +53,7 @@ def generate_break_test_code(test: Entry, break_func_name: str) -> str:
     )).strip()
     doc_detail = '\n    '.join([
         f'{i}. {x}' for i, x in enumerate(
-            re.findall(r'[\u00f7\u00d7][^\u00f7\u00d7]+', test.comment)
+            _RULE_STEP_PATTERN.findall(test.comment)
         )
     ])
 
@@ -8,7 +8,7 @@ from itertools import groupby
 from pprint import pformat
 from typing import Optional, TextIO
 
-from ucdtools import iter_code_point_properties
+from ucdtools import iter_code_point_property_spans
 
 
 def getsize(data: list) -> int:
@@ -38,6 +38,12 @@ def splitbins(t: tuple[int, ...]) -> tuple[list[int], list[int], int]:
             maxshift += 1
     del n
 
+    # the bins are compared as slices of the packed table, which are much
+    # faster to hash than tuples of ints
+    data = array.array({1: 'B', 2: 'H', 4: 'I'}[getsize(t)], t)
+    packed = data.tobytes()
+    itemsize = data.itemsize
+
     bytes = sys.maxsize  # smallest total size so far
     for shift in range(maxshift + 1):
         t1 = []
@@ -45,12 +51,12 @@ def splitbins(t: tuple[int, ...]) -> tuple[list[int], list[int], int]:
         size = 2 ** shift
         bincache = {}
         for i in range(0, len(t), size):
-            bin = t[i:i+size]
+            bin = packed[i*itemsize:(i+size)*itemsize]
             index = bincache.get(bin)
             if index is None:
                 index = len(t2)
                 bincache[bin] = index
-                t2.extend(bin)
+                t2.extend(data[i:i+size])
             t1.append(index >> shift)
         # determine memory size
         b = len(t1) * getsize(t1) + len(t2) * getsize(t2)
@@ -95,45 +101,47 @@ def main() -> None:
     prop_args: list[PropArg] = args.files
 
     names = []
-    db = [[] for _ in range(sys.maxunicode + 1)]
+    # values of every property, indexed by the code point
+    columns: list[list[str]] = []
     for prop_arg in prop_args:
         name = prop_arg.name
         stream = prop_arg.stream
-        items = iter_code_point_properties(stream)
+        spans = iter_code_point_property_spans(stream)
         if name:
             # named property
             print(name, file=sys.stderr)
             names.append(name)
-            item_dict = dict(items)
-            for cp in range(sys.maxunicode + 1):
-                record = item_dict.get(cp)
-                value = record.fields[0] if record else ''
-                db[cp].append(value)
+            column = [''] * (sys.maxunicode + 1)
+            for span, record in spans:
+                # (the same values share a string object, which makes the
+                # records faster to compare)
+                value = sys.intern(record.fields[0])
+                column[span.start:span.end + 1] = [value] * len(span)
+            columns.append(column)
         else:
             # unnamed property
-            for name, grouped_items in groupby(items, lambda x: x[1].fields[0]):
+            for name, grouped_spans in groupby(spans, lambda x: x[1].fields[0]):
                 print(name, file=sys.stderr)
                 names.append(name)
-                item_dict = dict(grouped_items)
-                for cp in range(sys.maxunicode + 1):
-                    record = item_dict.get(cp)
-                    if record:
-                        if len(record.fields) == 1:
-                            value = 'Y'
-                        elif len(record.fields) == 2:
-                            value = record.fields[1]
-                        else:
-                            raise ValueError(f'{len(record.fields)}=')
+                column = [''] * (sys.maxunicode + 1)
+                for span, record in grouped_spans:
+                    if len(record.fields) == 1:
+                        value = 'Y'
+                    elif len(record.fields) == 2:
+                        value = sys.intern(record.fields[1])
                     else:
-                        value = ''
-                    db[cp].append(value)
+                        raise ValueError(f'{len(record.fields)}=')
+                    column[span.start:span.end + 1] = [value] * len(span)
+                columns.append(column)
 
-    sparse_records = tuple(tuple(items) for items in db)
+    sparse_records = tuple(zip(*columns))
     unique_records = tuple(sorted(set(sparse_records)))
-    indices = tuple(unique_records.index(x) for x in sparse_records)
+    ranks = {x: i for i, x in enumerate(unique_records)}
+    indices = tuple(map(ranks.__getitem__, sparse_records))
     index1, index2, shift = splitbins(indices)
-    bytes1 = array.array('B', index1).tobytes()
-    bytes2 = array.array('B', index2).tobytes()
+    # (the tables must fit in bytes; bytes() raises ValueError otherwise)
+    bytes1 = bytes(index1)
+    bytes2 = bytes(index2)
 
     code = (
         f'# DO NOT EDIT.  This file is generated automatically.\n'
@@ -5,19 +5,17 @@ The UCD files are published under <https://www.unicode.org/Public/>.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
+from itertools import repeat
 from typing import (Iterable, Iterator, NamedTuple, Optional, TextIO, Union,
                     overload)
 
-RX_CODE_POINT_RANGE_LITERAL = re.compile(
-    r'(?P<cp1>[0-9A-Fa-f]{4,5})(?:\.\.(?P<cp2>[0-9A-Fa-f]{4,5}))?'
-)
-
 
 @dataclass(init=False, repr=False, order=True)
 class CodePointSpan:
     """A data class which represents a certain range of code points."""
+    # one instance is made for every record of the UCD files
+    __slots__ = ('start', 'end')
     start: int
     end: int
 
@@ -50,11 +48,15 @@ class CodePointSpan:
 
     def __init__(self, arg1: Union[str, int], arg2: Optional[int] = None, /) -> None:
         if isinstance(arg1, str):
-            m = RX_CODE_POINT_RANGE_LITERAL.match(arg1)
-            if m is None:
-                raise ValueError(f'invalid code point range leteral: {arg1!r}')
-            arg1 = int(m.group('cp1'), 16)
-            arg2 = int(_, 16) if (_ := m.group('cp2')) else None
+            # parse the literal directly, which is done for every record of
+            # the UCD files
+            cp1, sep, cp2 = arg1.partition('..')
+            try:
+                arg1, arg2 = int(cp1, 16), int(cp2, 16) if sep else None
+            except ValueError:
+                raise ValueError(
+                    f'invalid code point range leteral: {arg1!r}'
+                ) from None
         if arg2 is not None and arg2 <= arg1:
             raise ValueError('end is greater than start')
         self.start = arg1
@@ -66,10 +68,17 @@ class CodePointSpan:
         >>> list(CodePointSpan(0x0600, 0x0605))
         [1536, 1537, 1538, 1539, 1540, 1541]
         """
-        if self.end is None:
-            yield self.start
-        else:
-            yield from range(self.start, self.end + 1)
+        return iter(range(self.start, self.end + 1))
+
+    def __contains__(self, cp: int, /) -> bool:
+        """Return if the code point `cp` is in the range.
+
+        >>> 0x0605 in CodePointSpan('0600..0605')
+        True
+        >>> 0x0606 in CodePointSpan('0600..0605')
+        False
+        """
+        return self.start <= cp <= self.end
 
     def __len__(self) -> int:
         """Return the number of the code points which the instance represents.
@@ -79,7 +88,7 @@ class CodePointSpan:
         >>> len(CodePointSpan(0x06dd))
         1
         """
-        return 1 if self.end is None else self.end - self.start + 1
+        return self.end - self.start + 1
 
     def __repr__(self) -> str:
         """Return `repr()` expression for the instance.
@@ -144,11 +153,7 @@ def split_comment(line: str, /) -> tuple[str, str]:
     >>> split_comment('data')
     ('data', '')
     """
-    if '#' in line:
-        data, comment = line.split('#', 1)
-    else:
-        data = line
-        comment = ''
+    data, __, comment = line.partition('#')
     return data.strip(), comment.strip()
 
 
@@ -158,20 +163,34 @@ def iter_records(stream: TextIO, /) -> Iterator[UcdRecord]:
         # strip comment
         field_part, comment_part = split_comment(line)
         if field_part:
-            fields = tuple(x.strip() for x in field_part.split(';'))
+            fields = tuple(map(str.strip, field_part.split(';')))
             yield UcdRecord(fields, comment_part)
 
 
-def iter_code_point_properties(stream: TextIO, /) -> Iterator[tuple[int, UcdRecord]]:
-    """Iterate tuples of code point interger and property string for every
-    code point described in the UCD property text.
+def iter_code_point_property_spans(
+    stream: TextIO, /
+) -> Iterator[tuple[CodePointSpan, UcdRecord]]:
+    """Iterate tuples of code point span and property record for every
+    record described in the UCD property text.
+
+    >>> from io import StringIO
+    >>> stream = StringIO('0600..0605 ; Prepend # Cf   [6] ARABIC ...')
+    >>> for span, record in iter_code_point_property_spans(stream):
+    ...     print(span, record.fields)
+    <CodePointSpan [0600..0605]> ('Prepend',)
     """
     for record in iter_records(stream):
         fields, comment = record
         if len(fields) > 1:
-            span = CodePointSpan(fields[0])
-            for cp in span:
-                yield cp, UcdRecord(fields[1:], comment)
+            yield CodePointSpan(fields[0]), UcdRecord(fields[1:], comment)
+
+
+def iter_code_point_properties(stream: TextIO, /) -> Iterator[tuple[int, UcdRecord]]:
+    """Iterate tuples of code point interger and property string for every
+    code point described in the UCD property text.
+    """
+    for span, record in iter_code_point_property_spans(stream):
+        yield from zip(span, repeat(record))
 
 
 def group_continuous(iterable: Iterable[int], /) -> Iterator[Iterable[int]]: